@@ -0,0 +1,48 @@
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "tests"))
+from bench_suite import ensure_dataset
+from export_figure import app_figure
+
+def time_script(script, args, repeat):
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, script, *args], check=True)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+def export(path, out_dir, name):
+    from schplot.export import export_script
+    script = str(out_dir / f"{name}.py")
+    datasets, plots, stats, view = app_figure(path)
+    with open(script, "w", encoding="utf-8") as handle:
+        handle.write(export_script(datasets, plots, view, stats))
+    return script
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time exported plot scripts.")
+    parser.add_argument("--sizes", type=float, nargs="+", default=[1e4, 1e5, 1e6])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--data-dir", default=os.path.join(tempfile.gettempdir(), "schplot-bench"))
+    args = parser.parse_args(argv)
+    os.environ["SCHPLOT_CACHE_DIR"] = os.path.join(args.data_dir, "cache")
+    out_dir = Path(args.data_dir) / "export"
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for rows in (int(size) for size in args.sizes):
+        script = export(str(ensure_dataset(args.data_dir, rows, "csv")), out_dir, f"export_{rows}")
+        output = str(out_dir / f"export_{rows}.svg")
+        for mode, extra in (("refit", []), ("precomputed", ["--precomputed"]), ("rasterized", ["--precomputed", "--rasterize"])):
+            print(f"{mode:<12} {rows:>10} {time_script(script, ['-o', output, *extra], args.repeat):>8.3f} s")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
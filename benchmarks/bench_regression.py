@@ -0,0 +1,106 @@
+import argparse
+import sys
+import time
+from pathlib import Path
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from schplot.logic import calculate_regression_stats
+
+REGRESSION_TYPES = ["Linear", "Exponential", "Logarithmic"]
+COMPARED_KEYS = ["se", "stderr_slope", "r2", "adj_r2", "rmse", "mae"]
+
+def _r2_score(y, y_pred):
+    return 1 - np.sum((y - y_pred) ** 2) / np.sum((y - np.mean(y)) ** 2)
+
+def reference_regression_stats(x, y, regression_type):
+    stats = {}
+    if regression_type == "Linear":
+        z = np.polyfit(x, y, 1)
+        y_pred = np.poly1d(z)(x)
+        n = len(x)
+        residuals = y - y_pred
+        se = np.sqrt(np.sum(residuals**2) / (n - 2))
+        stderr_slope = se / np.sqrt(np.sum((x - np.mean(x))**2))
+        r2 = _r2_score(y, y_pred)
+        stats.update({
+            "coefficients": (z[0], z[1]),
+            "se": se,
+            "stderr_slope": stderr_slope,
+            "r2": r2,
+            "adj_r2": 1 - (1 - r2) * (n - 1) / (n - 2),
+            "rmse": np.sqrt(np.mean((y - y_pred) ** 2)),
+            "mae": np.mean(np.abs(residuals))
+        })
+    elif regression_type == "Exponential":
+        mask = y > 0
+        x_clean, y_clean = x[mask], y[mask]
+        z = np.polyfit(x_clean, np.log(y_clean), 1)
+        y_pred = np.exp(np.poly1d(z)(x_clean))
+        stats.update({
+            "coefficients": (z[1], z[0]),
+            "r2": _r2_score(y_clean, y_pred),
+            "rmse": np.sqrt(np.mean((y_clean - y_pred) ** 2)),
+            "mae": np.mean(np.abs(y_clean - y_pred))
+        })
+    elif regression_type == "Logarithmic":
+        mask = x > 0
+        x_clean, y_clean = x[mask], y[mask]
+        z = np.polyfit(np.log(x_clean), y_clean, 1)
+        y_pred = np.poly1d(z)(np.log(x_clean))
+        stats.update({
+            "coefficients": (z[0], z[1]),
+            "r2": _r2_score(y_clean, y_pred),
+            "rmse": np.sqrt(np.mean((y_clean - y_pred) ** 2)),
+            "mae": np.mean(np.abs(y_clean - y_pred))
+        })
+    return stats
+
+def synthetic_data(n, regression_type, seed=0):
+    rng = np.random.default_rng(seed)
+    x = np.linspace(1.0, 100.0, n)
+    if regression_type == "Exponential":
+        y = 2.5 * np.exp(0.03 * x) * rng.lognormal(0.0, 0.05, n)
+    elif regression_type == "Logarithmic":
+        y = 4.0 * np.log(x) + 1.5 + rng.normal(0.0, 0.2, n)
+    else:
+        y = 0.75 * x + 3.0 + rng.normal(0.0, 1.0, n)
+    return x, y
+
+def best_time(func, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def max_relative_error(stats, reference):
+    errors = [abs(a - b) / max(abs(b), 1e-300) for a, b in zip(stats["coefficients"], reference["coefficients"])]
+    errors += [abs(stats[key] - reference[key]) / max(abs(reference[key]), 1e-300) for key in COMPARED_KEYS if key in reference]
+    return max(errors)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare calculate_regression_stats against the polyfit reference.")
+    parser.add_argument("--sizes", type=float, nargs="+", default=[1e5, 1e6, 1e7])
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--rtol", type=float, default=1e-8)
+    args = parser.parse_args(argv)
+    failed = False
+    print(f"{'type':<12} {'points':>12} {'reference s':>12} {'kernel s':>12} {'speedup':>8} {'max rel err':>12}")
+    for n in (int(size) for size in args.sizes):
+        for regression_type in REGRESSION_TYPES:
+            x, y = synthetic_data(n, regression_type)
+            stats = calculate_regression_stats(x, y, regression_type)
+            reference = reference_regression_stats(x, y, regression_type)
+            error = max_relative_error(stats, reference)
+            failed |= error > args.rtol
+            reference_time = best_time(lambda: reference_regression_stats(x, y, regression_type), args.repeat)
+            kernel_time = best_time(lambda: calculate_regression_stats(x, y, regression_type), args.repeat)
+            print(f"{regression_type:<12} {n:>12} {reference_time:>12.4f} {kernel_time:>12.4f} {reference_time / kernel_time:>7.1f}x {error:>12.2e}")
+    if failed:
+        print(f"FAILED: results differ from the reference by more than rtol={args.rtol}")
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
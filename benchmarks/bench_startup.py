@@ -0,0 +1,66 @@
+import argparse
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+LAZY_MODULES = ["pandas", "openpyxl", "sklearn", "scipy", "matplotlib.pyplot"]
+STARTUP_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+from PyQt5.QtWidgets import QApplication
+from schplot.ui import DataPlottingGUI
+app = QApplication(sys.argv)
+window = DataPlottingGUI()
+window.show()
+app.processEvents()
+elapsed = time.perf_counter() - start
+print(json.dumps({"window_ms": elapsed * 1000, "modules": sorted(sys.modules)}))
+"""
+
+def parse_importtime(stderr):
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        imports.append((name.strip(), depth, int(self_us), int(cumulative_us)))
+    return imports
+
+def measure_startup():
+    env = dict(os.environ)
+    env.setdefault("QT_QPA_PLATFORM", "offscreen")
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT), env.get("PYTHONPATH")]))
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c", STARTUP_SCRIPT], capture_output=True, text=True, env=env, check=True)
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    result["imports"] = parse_importtime(completed.stderr)
+    return result
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure how long Schplot takes to show its main window.")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--budget-ms", type=float, default=1500.0, help="fail if the best window time exceeds this")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args(argv)
+    runs = [measure_startup() for _ in range(args.repeat)]
+    best = min(runs, key=lambda run: run["window_ms"])
+    top_level = sorted((entry for entry in best["imports"] if entry[1] <= 1), key=lambda entry: -entry[3])
+    print(f"{'module':<40} {'cumulative ms':>14}")
+    for name, _, _, cumulative_us in top_level[:args.top]:
+        print(f"{name:<40} {cumulative_us / 1000:>14.1f}")
+    print(f"window shown after {best['window_ms']:.1f} ms (best of {args.repeat}, budget {args.budget_ms:.0f} ms)")
+    eager = [name for name in LAZY_MODULES if name in best["modules"]]
+    failed = False
+    if eager:
+        print(f"FAILED: imported before the first file was opened: {', '.join(eager)}")
+        failed = True
+    if best["window_ms"] > args.budget_ms:
+        print("FAILED: startup is over budget")
+        failed = True
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
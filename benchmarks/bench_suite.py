@@ -0,0 +1,216 @@
+import argparse
+import csv
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+import numpy as np
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+COLUMNS = ["x", "linear", "exponential", "logarithmic"]
+REGRESSION_COLUMNS = {"Linear": "linear", "Exponential": "exponential", "Logarithmic": "logarithmic"}
+CASES = ["load_csv", "load_csv_cached", "load_xlsx", "regression_linear", "regression_exponential", "regression_logarithmic", "render"]
+WRITE_ROWS = 1 << 18
+
+def synthetic_columns(start, stop, seed=0):
+    rng = np.random.default_rng(seed + start)
+    x = np.arange(start, stop, dtype=np.float64) / 1000.0 + 1.0
+    return {
+        "x": x,
+        "linear": 0.75 * x + 3.0 + rng.normal(0.0, 1.0, len(x)),
+        "exponential": 2.5 * np.exp(0.03 * (x % 100)) * rng.lognormal(0.0, 0.05, len(x)),
+        "logarithmic": 4.0 * np.log(x) + 1.5 + rng.normal(0.0, 0.2, len(x))
+    }
+
+def format_value(value):
+    return f"{value:.6f}".replace(".", ",")
+
+def write_csv(path, rows, seed=0):
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle, quoting=csv.QUOTE_ALL)
+        writer.writerow(COLUMNS)
+        for start in range(0, rows, WRITE_ROWS):
+            columns = synthetic_columns(start, min(start + WRITE_ROWS, rows), seed)
+            values = [[format_value(value) for value in columns[col]] for col in COLUMNS]
+            records = list(zip(*values))
+            for index in range(999 - start % 1000, len(records), 1000):
+                records[index] = records[index][:1] + ("n/a",) + records[index][2:]
+            writer.writerows(records)
+    os.replace(tmp, path)
+
+def write_xlsx(path, rows, seed=0):
+    import pandas as pd
+    tmp = path.with_name(path.stem + ".tmp.xlsx")
+    pd.DataFrame(synthetic_columns(0, rows, seed)).to_excel(tmp, index=False)
+    os.replace(tmp, path)
+
+def dataset_path(data_dir, rows, extension):
+    return Path(data_dir) / f"synthetic_{rows}.{extension}"
+
+def ensure_dataset(data_dir, rows, extension):
+    path = dataset_path(data_dir, rows, extension)
+    if not path.exists():
+        path.parent.mkdir(parents=True, exist_ok=True)
+        print(f"generating {path}", file=sys.stderr)
+        (write_csv if extension == "csv" else write_xlsx)(path, rows)
+    return path
+
+def setup_case(name, rows, args):
+    from schplot.dataset import open_dataset
+    if name == "load_csv":
+        path = str(dataset_path(args.data_dir, rows, "csv"))
+        return lambda: open_dataset(path, cache=False).load(COLUMNS)
+    if name == "load_csv_cached":
+        path = str(dataset_path(args.data_dir, rows, "csv"))
+        open_dataset(path).load(COLUMNS)
+        def load_cached():
+            dataset = open_dataset(path).load(COLUMNS)
+            return [float(np.sum(dataset.column(col))) for col in COLUMNS]
+        return load_cached
+    if name == "load_xlsx":
+        path = str(dataset_path(args.data_dir, rows, "xlsx"))
+        return lambda: open_dataset(path, cache=False).load(COLUMNS)
+    columns = synthetic_columns(0, rows)
+    if name.startswith("regression_"):
+        from schplot.logic import calculate_regression_stats
+        regression_type = name[len("regression_"):].capitalize()
+        x, y = columns["x"], columns[REGRESSION_COLUMNS[regression_type]]
+        return lambda: calculate_regression_stats(x, y, regression_type)
+    if name == "render":
+        return lambda: render_series(columns, args.series)
+    raise ValueError(f"Unknown case: {name}")
+
+def render_series(columns, series):
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from schplot.plot_settings import PlotSettings
+    from schplot.plotting import ArtistRegistry, decorate_axes
+    figure = Figure(figsize=(10, 6), dpi=100)
+    canvas = FigureCanvasAgg(figure)
+    ax = figure.add_subplot()
+    registry = ArtistRegistry(ax, interactive=False)
+    x = columns["x"]
+    for index in range(series):
+        plot = PlotSettings()
+        plot.label = f"Series {index + 1}"
+        plot.y_var = COLUMNS[1 + index % 3]
+        plot.show_line = index % 2 == 0
+        y = columns[plot.y_var] + index
+        entry = registry.entry(plot)
+        entry.load_result(plot, (x, y, None, None))
+        entry.show(plot)
+    decorate_axes(ax, registry, "Benchmark", "x", "y", True)
+    registry.autoscale()
+    canvas.draw()
+
+def peak_rss_mb():
+    try:
+        with open("/proc/self/status", encoding="ascii") as handle:
+            for line in handle:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1 << 20) if sys.platform == "darwin" else peak / 1024
+
+def run_case(name, rows, args):
+    func = setup_case(name, rows, args)
+    setup_rss = peak_rss_mb()
+    times = []
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return {"case": name, "rows": rows, "best_s": min(times), "mean_s": sum(times) / len(times), "setup_rss_mb": setup_rss, "peak_rss_mb": peak_rss_mb()}
+
+def measure(name, rows, args):
+    command = [sys.executable, __file__, "--run-case", name, "--rows", str(rows), "--repeat", str(args.repeat), "--series", str(args.series), "--data-dir", str(args.data_dir)]
+    completed = subprocess.run(command, capture_output=True, text=True)
+    if completed.returncode != 0:
+        return {"case": name, "rows": rows, "error": completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else "failed"}
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+def environment():
+    import matplotlib
+    import pandas
+    return {"python": platform.python_version(), "platform": platform.platform(), "numpy": np.__version__, "pandas": pandas.__version__, "matplotlib": matplotlib.__version__}
+
+def compare(results, baseline, threshold, min_seconds):
+    previous = {(entry["case"], entry["rows"]): entry for entry in baseline["results"]}
+    slower = []
+    print(f"{'case':<24} {'rows':>10} {'before s':>10} {'after s':>10} {'ratio':>7} {'rss before':>11} {'rss after':>10}")
+    for entry in results:
+        old = previous.get((entry["case"], entry["rows"]))
+        if old is None or "best_s" not in old or "best_s" not in entry:
+            continue
+        ratio = entry["best_s"] / max(old["best_s"], 1e-12)
+        regressed = ratio > threshold and entry["best_s"] - old["best_s"] > min_seconds
+        flag = " SLOWER" if regressed else ""
+        print(f"{entry['case']:<24} {entry['rows']:>10} {old['best_s']:>10.4f} {entry['best_s']:>10.4f} {ratio:>6.2f}x {old.get('peak_rss_mb') or 0:>10.0f}M {entry.get('peak_rss_mb') or 0:>9.0f}M{flag}")
+        if regressed:
+            slower.append(entry)
+    return slower
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time Schplot's load, regression and render paths on synthetic data and record peak memory.")
+    parser.add_argument("--sizes", type=float, nargs="+", default=[1e3, 1e4, 1e5, 1e6, 1e7])
+    parser.add_argument("--cases", nargs="+", default=CASES, choices=CASES)
+    parser.add_argument("--xlsx-max-rows", type=float, default=1e5, help="skip load_xlsx above this size (Excel and openpyxl are slow)")
+    parser.add_argument("--series", type=int, default=10, help="number of layered series in the render case")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--data-dir", default=os.path.join(tempfile.gettempdir(), "schplot-bench"))
+    parser.add_argument("-o", "--output", help="write the JSON report to this file")
+    parser.add_argument("--compare", help="JSON report of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=1.1, help="flag cases slower than this ratio when comparing")
+    parser.add_argument("--min-seconds", type=float, default=0.001, help="ignore slowdowns smaller than this many seconds")
+    parser.add_argument("--run-case", help=argparse.SUPPRESS)
+    parser.add_argument("--rows", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+    if args.run_case:
+        os.environ["SCHPLOT_CACHE_DIR"] = os.path.join(args.data_dir, "cache")
+        print(json.dumps(run_case(args.run_case, args.rows, args)))
+        return 0
+    results = []
+    for rows in (int(size) for size in args.sizes):
+        for name in args.cases:
+            if name == "load_xlsx" and rows > args.xlsx_max_rows:
+                continue
+            if name.startswith("load_"):
+                ensure_dataset(args.data_dir, rows, "xlsx" if name == "load_xlsx" else "csv")
+            entry = measure(name, rows, args)
+            results.append(entry)
+            if "error" in entry:
+                print(f"{name:<24} {rows:>10} error: {entry['error']}")
+            else:
+                print(f"{name:<24} {rows:>10} {entry['best_s']:>10.4f} s {entry['peak_rss_mb'] or 0:>8.0f} MB")
+    report = {"environment": environment(), "series": args.series, "repeat": args.repeat, "results": results}
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+    failed = any("error" in entry for entry in results)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as handle:
+            baseline = json.load(handle)
+        slower = compare(results, baseline, args.threshold, args.min_seconds)
+        if slower:
+            print(f"FAILED: {len(slower)} case(s) slower than {args.threshold:.2f}x the baseline")
+            failed = True
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -1,12 +1,16 @@
 import sys
-from PyQt5.QtWidgets import QApplication
-from .ui import DataPlottingGUI
 
-def main():
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["render"]:
+        from .render import main as render_main
+        sys.exit(render_main(argv[1:]))
+    from PyQt5.QtWidgets import QApplication
+    from .ui import DataPlottingGUI
     app = QApplication(sys.argv)
     window = DataPlottingGUI()
     window.show()
     sys.exit(app.exec_())
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
\ No newline at end of file
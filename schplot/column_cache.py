@@ -0,0 +1,161 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+import numpy as np
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+INDEX_FILE = "index.json"
+LOCK_FILE = "index.lock"
+MAX_CACHE_BYTES = 4 * 1024 ** 3
+
+def cache_root():
+    root = os.environ.get("SCHPLOT_CACHE_DIR")
+    if root:
+        return Path(root)
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "schplot"
+
+def cache_max_bytes():
+    value = os.environ.get("SCHPLOT_CACHE_MAX_BYTES")
+    return int(value) if value else MAX_CACHE_BYTES
+
+def source_signature(path):
+    file_stat = os.stat(path)
+    return {"path": os.path.abspath(path), "size": file_stat.st_size, "mtime_ns": file_stat.st_mtime_ns}
+
+def _write_atomic(target, write):
+    with tempfile.NamedTemporaryFile(dir=target.parent, prefix=target.name + ".", suffix=".tmp", delete=False) as handle:
+        tmp = handle.name
+        try:
+            write(handle)
+        except BaseException:
+            handle.close()
+            os.unlink(tmp)
+            raise
+    try:
+        os.replace(tmp, target)
+    except OSError:
+        os.unlink(tmp)
+        raise
+
+@contextmanager
+def _locked(directory):
+    with open(directory / LOCK_FILE, "a+b") as handle:
+        if fcntl is not None:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+        else:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+            else:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+def _read_index(directory):
+    try:
+        with open(directory / INDEX_FILE, encoding="utf-8") as handle:
+            return json.load(handle)
+    except (OSError, ValueError):
+        return None
+
+class ColumnCache:
+    def __init__(self, path, root=None, max_bytes=None, signature=None):
+        self.signature = signature or source_signature(path)
+        key = hashlib.blake2b(json.dumps(self.signature, sort_keys=True).encode(), digest_size=16).hexdigest()
+        self.root = Path(root) if root is not None else cache_root()
+        self.max_bytes = cache_max_bytes() if max_bytes is None else max_bytes
+        self.directory = self.root / key
+        self.index = {"source": self.signature, "columns": None, "arrays": {}, "atime": time.time()}
+        index = _read_index(self.directory)
+        if index is not None and index.get("source") == self.signature:
+            self.index = index
+
+    @property
+    def columns(self):
+        return self.index["columns"]
+
+    def set_columns(self, columns):
+        columns = list(columns)
+        if not all(isinstance(name, str) for name in columns):
+            return
+        self.index["columns"] = columns
+        self.index["arrays"] = {}
+        self._save_index()
+        self.prune_stale()
+
+    def get(self, name, dtype):
+        position = self._position(name)
+        entry = self.index["arrays"].get(position)
+        if entry is None or entry["dtype"] != np.dtype(dtype).str:
+            return None
+        try:
+            return np.load(self.directory / entry["file"], mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+
+    def touch(self):
+        self._save_index()
+
+    def put(self, name, array):
+        position = self._position(name)
+        if position is None or array.nbytes > self.max_bytes:
+            return
+        file_name = f"{position}.npy"
+        try:
+            _write_atomic(self.directory / file_name, lambda handle: np.save(handle, array))
+            self.index["arrays"][position] = {"file": file_name, "dtype": array.dtype.str, "length": len(array), "bytes": os.path.getsize(self.directory / file_name)}
+            self._save_index()
+        except OSError:
+            return
+        self.evict()
+
+    def prune_stale(self):
+        for directory, index in self._siblings():
+            if index.get("source", {}).get("path") == self.signature["path"]:
+                shutil.rmtree(directory, ignore_errors=True)
+
+    def evict(self):
+        entries = sorted((index.get("atime", 0), directory, sum(entry.get("bytes", 0) for entry in index.get("arrays", {}).values())) for directory, index in self._siblings())
+        total = sum(size for _, _, size in entries) + sum(entry.get("bytes", 0) for entry in self.index["arrays"].values())
+        for _, directory, size in entries:
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(directory, ignore_errors=True)
+            total -= size
+
+    def _siblings(self):
+        try:
+            directories = [d for d in self.root.iterdir() if d.is_dir() and d != self.directory]
+        except OSError:
+            return []
+        return [(directory, index) for directory, index in ((d, _read_index(d)) for d in directories) if index is not None]
+
+    def _position(self, name):
+        columns = self.index["columns"] or []
+        return str(columns.index(name)) if name in columns else None
+
+    def _save_index(self):
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with _locked(self.directory):
+                saved = _read_index(self.directory)
+                if saved is not None and saved.get("source") == self.signature and saved.get("columns") == self.index["columns"]:
+                    self.index["arrays"] = dict(saved.get("arrays", {}), **self.index["arrays"])
+                self.index["atime"] = time.time()
+                data = json.dumps(self.index).encode("utf-8")
+                _write_atomic(self.directory / INDEX_FILE, lambda handle: handle.write(data))
+        except OSError:
+            pass
\ No newline at end of file
@@ -0,0 +1,179 @@
+import io
+import os
+import threading
+import numpy as np
+from .column_cache import ColumnCache, source_signature
+from .profiling import profiler
+
+CSV_OPTIONS = {"decimal": ",", "thousands": ".", "encoding": "utf-8"}
+CHUNK_ROWS = 1 << 20
+
+def read_header(path):
+    with profiler.stage("header"):
+        return _read_header(path)
+
+def _read_header(path):
+    import pandas as pd
+    if path.endswith('.csv'):
+        return list(pd.read_csv(path, nrows=0, **CSV_OPTIONS).columns)
+    if path.endswith('.xlsx'):
+        return [col for col in pd.read_excel(path, nrows=0).columns if 'Unnamed:' not in str(col)]
+    raise ValueError(f"Unsupported file type: {path}")
+
+class _BoundedReader(io.RawIOBase):
+    def __init__(self, handle, end):
+        self.handle = handle
+        self.end = end
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        size = min(len(buffer), self.end - self.handle.tell())
+        if size <= 0:
+            return 0
+        return self.handle.readinto(memoryview(buffer)[:size])
+
+def iter_chunks(path, columns, chunk_rows=CHUNK_ROWS, progress=None, end=None):
+    import pandas as pd
+    if path.endswith('.csv'):
+        size = max(os.path.getsize(path) if end is None else end, 1)
+        with open(path, 'rb') as handle:
+            source = handle if end is None else io.BufferedReader(_BoundedReader(handle, end))
+            reader = pd.read_csv(source, usecols=columns, chunksize=chunk_rows, **CSV_OPTIONS)
+            while True:
+                with profiler.stage("parse"):
+                    chunk = next(reader, None)
+                if chunk is None:
+                    break
+                yield chunk
+                if progress is not None:
+                    progress(min(handle.tell() / size, 1.0))
+    else:
+        with profiler.stage("parse"):
+            frame = pd.read_excel(path, usecols=columns)
+        yield frame
+        if progress is not None:
+            progress(1.0)
+
+def trailing_fragment(path, end, block=1 << 16):
+    fragment = b''
+    with open(path, 'rb') as handle:
+        while end > 0:
+            start = max(end - block, 0)
+            handle.seek(start)
+            data = handle.read(end - start)
+            newline = data.rfind(b'\n')
+            if newline >= 0:
+                return data[newline + 1:] + fragment
+            fragment = data + fragment
+            end = start
+    return fragment
+
+def to_array(values, dtype=np.float64):
+    import pandas as pd
+    return pd.to_numeric(values, errors='coerce').to_numpy(dtype=dtype, na_value=np.nan)
+
+def load_columns(path, columns, dtype=np.float64, chunk_rows=CHUNK_ROWS, progress=None, end=None):
+    parts = {col: [] for col in columns}
+    for chunk in iter_chunks(path, columns, chunk_rows, progress, end):
+        for col in columns:
+            with profiler.stage("coerce", col):
+                parts[col].append(to_array(chunk[col], dtype))
+    return {col: np.concatenate(chunks) if chunks else np.empty(0, dtype=dtype) for col, chunks in parts.items()}
+
+class Dataset:
+    def __init__(self, path, dtype=np.float64, cache=True):
+        self.path = path
+        self.dtype = dtype
+        file_stat = os.stat(path)
+        self.version = (os.path.abspath(path), file_stat.st_size, file_stat.st_mtime_ns)
+        self.cache = ColumnCache(path) if cache else None
+        if self.cache is not None and self.cache.columns is not None:
+            self.columns = self.cache.columns
+        else:
+            self.columns = read_header(path)
+            if self.cache is not None:
+                self.cache.set_columns(self.columns)
+        self.end = None
+        self.partial = b''
+        self.partial_values = None
+        self._arrays = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_arrays(cls, path, arrays, columns=None, version=None, dtype=np.float64):
+        dataset = cls.__new__(cls)
+        dataset.path = path
+        dataset.dtype = dtype
+        dataset.version = tuple(version) if version is not None else (os.path.abspath(path), 0, 0)
+        dataset.cache = None
+        dataset.end = None
+        dataset.partial = b''
+        dataset.partial_values = None
+        dataset.columns = list(columns) if columns is not None else list(arrays)
+        dataset._arrays = dict(arrays)
+        dataset._lock = threading.Lock()
+        return dataset
+
+    def __contains__(self, name):
+        return name in self.columns
+
+    def loaded(self, name):
+        return name in self._arrays
+
+    def load(self, names, progress=None):
+        with self._lock:
+            missing = [name for name in dict.fromkeys(names) if name in self.columns and name not in self._arrays]
+            if missing and self.end is None:
+                self._snapshot()
+            if missing and self.cache is not None:
+                for name in missing:
+                    with profiler.stage("cache", name):
+                        array = self.cache.get(name, self.dtype)
+                    if array is not None:
+                        self._arrays[name] = array
+                if any(name in self._arrays for name in missing):
+                    self.cache.touch()
+                missing = [name for name in missing if name not in self._arrays]
+            if missing:
+                arrays = load_columns(self.path, missing, self.dtype, progress=progress, end=self.end)
+                if self.partial_values is not None:
+                    arrays = {name: np.concatenate((array, self.partial_values[name])) for name, array in arrays.items()}
+                self._arrays.update(arrays)
+                if self.cache is not None:
+                    for name, array in arrays.items():
+                        self.cache.put(name, array)
+        return self
+
+    def _snapshot(self):
+        signature = source_signature(self.path)
+        self.partial = trailing_fragment(self.path, signature["size"]) if self.path.endswith('.csv') else b''
+        if len(self.partial) == signature["size"]:
+            self.partial = b''
+        self.end = signature["size"] - len(self.partial)
+        self.partial_values = self._parse_partial()
+        self.version = (signature["path"], signature["size"], signature["mtime_ns"])
+        if self.cache is not None and signature != self.cache.signature:
+            self.cache = ColumnCache(self.path, signature=signature)
+            if self.cache.columns is None:
+                self.cache.set_columns(self.columns)
+
+    def _parse_partial(self):
+        if not self.partial.strip():
+            return None
+        import pandas as pd
+        try:
+            frame = pd.read_csv(io.BytesIO(self.partial), header=None, names=self.columns, **CSV_OPTIONS)
+        except ValueError:
+            return None
+        return {col: to_array(frame[col], self.dtype) for col in self.columns}
+
+    def column(self, name):
+        if name not in self.columns:
+            raise KeyError(name)
+        self.load([name])
+        return self._arrays[name]
+
+def open_dataset(path, dtype=np.float64, cache=True, progress=None):
+    return Dataset(path, dtype, cache)
\ No newline at end of file
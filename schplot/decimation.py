@@ -0,0 +1,53 @@
+import numpy as np
+
+def _visible_indices(x, x_range):
+    lo, hi = x_range
+    inside = (x >= lo) & (x <= hi)
+    keep = inside.copy()
+    keep[1:] |= inside[:-1]
+    keep[:-1] |= inside[1:]
+    return np.flatnonzero(keep)
+
+def decimate_line(x, y, x_range, n_buckets):
+    idx = _visible_indices(x, x_range)
+    if len(idx) <= 4 * n_buckets:
+        return x[idx], y[idx]
+    lo, hi = x_range
+    span = hi - lo
+    if span <= 0:
+        return x[idx], y[idx]
+    bucket = ((x[idx] - lo) * (n_buckets / span)).astype(np.int64)
+    np.clip(bucket, 0, n_buckets - 1, out=bucket)
+    by_y = np.lexsort((y[idx], bucket))
+    by_pos = np.argsort(bucket, kind="stable")
+    starts = np.flatnonzero(np.r_[True, bucket[by_pos][1:] != bucket[by_pos][:-1]])
+    ends = np.r_[starts[1:], len(idx)] - 1
+    picks = np.concatenate((by_pos[starts], by_pos[ends], by_y[starts], by_y[ends]))
+    picks = idx[np.unique(picks)]
+    return x[picks], y[picks]
+
+def decimate_scatter(x, y, x_range, y_range, width, height):
+    lo_x, hi_x = x_range
+    lo_y, hi_y = y_range
+    inside = (x >= lo_x) & (x <= hi_x) & (y >= lo_y) & (y <= hi_y)
+    idx = np.flatnonzero(inside)
+    if len(idx) <= 4 * max(width, height) or hi_x <= lo_x or hi_y <= lo_y:
+        return x[idx], y[idx]
+    px = ((x[idx] - lo_x) * (width / (hi_x - lo_x))).astype(np.int64)
+    py = ((y[idx] - lo_y) * (height / (hi_y - lo_y))).astype(np.int64)
+    np.clip(px, 0, width - 1, out=px)
+    np.clip(py, 0, height - 1, out=py)
+    _, first = np.unique(px * height + py, return_index=True)
+    picks = idx[np.sort(first)]
+    return x[picks], y[picks]
+
+def data_range(values):
+    if len(values) == 0:
+        return (0.0, 1.0)
+    lo, hi = float(np.min(values)), float(np.max(values))
+    if np.isfinite(lo) and np.isfinite(hi):
+        return (lo, hi)
+    values = values[np.isfinite(values)]
+    if len(values) == 0:
+        return (0.0, 1.0)
+    return (float(np.min(values)), float(np.max(values)))
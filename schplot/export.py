@@ -0,0 +1,173 @@
+import pprint
+from .dataset import CSV_OPTIONS
+from .plotting import REGRESSION_NAMES, REGRESSION_POINTS, fit_range
+
+RASTERIZE_POINTS = 100000
+FIGSIZE = (10, 6)
+DPI = 100
+
+SCRIPT_BODY = '''
+def load(path, columns):
+    if path.endswith(".csv"):
+        frame = pd.read_csv(path, usecols=columns, **CSV_OPTIONS)
+    else:
+        frame = pd.read_excel(path, usecols=columns)
+    return {column: pd.to_numeric(frame[column], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan) for column in columns}
+
+def fit(x, y, regression):
+    if regression == "Exponential":
+        mask = y > 0
+        u, v = x[mask], np.log(y[mask])
+    elif regression == "Logarithmic":
+        mask = x > 0
+        u, v = np.log(x[mask]), y[mask]
+    else:
+        mask = np.ones(len(x), dtype=bool)
+        u, v = x, y
+    if len(u) < 2:
+        return None
+    du = u - u.mean()
+    dv = v - v.mean()
+    suu = np.dot(du, du)
+    if not suu > 0:
+        return None
+    slope = np.dot(du, dv) / suu
+    intercept = v.mean() - slope * u.mean()
+    if regression == "Exponential":
+        y_clean = y[mask]
+        residuals = y_clean - np.exp(slope * u + intercept)
+        dy = y_clean - y_clean.mean()
+        ss_tot = np.dot(dy, dy)
+    else:
+        residuals = v - (slope * u + intercept)
+        ss_tot = np.dot(dv, dv)
+    ss_res = np.dot(residuals, residuals)
+    r2 = 1 - ss_res / ss_tot if ss_tot > 0 else float(ss_res == 0)
+    x_clean = x[mask]
+    return (slope, intercept), r2, (x_clean.min(), x_clean.max())
+
+def curve(regression, coefficients, x_range):
+    slope, intercept = coefficients
+    x_fit = np.linspace(*x_range, REGRESSION_POINTS)
+    if regression == "Exponential":
+        return x_fit, np.exp(slope * x_fit + intercept), f"y = {np.exp(intercept):.6f} * e^({slope:.6f}x)"
+    if regression == "Logarithmic":
+        return x_fit, slope * np.log(x_fit) + intercept, f"y = {slope:.6f} * ln(x) + {intercept:.6f}"
+    return x_fit, slope * x_fit + intercept, f"y = {slope:.6f}x + {intercept:.6f}"
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Draw the figure exported from Schplot.")
+    parser.add_argument("-o", "--output", help="save the figure to this file instead of showing it")
+    parser.add_argument("--precomputed", action="store_true", help="use the regression coefficients exported from Schplot instead of fitting them again")
+    parser.add_argument("--rasterize", action="store_true", help=f"rasterize series with more than {RASTERIZE_POINTS} points")
+    args = parser.parse_args(argv)
+    import matplotlib
+    if args.output:
+        matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    data = {name: load(path, columns) for name, (path, columns) in FILES.items()}
+    fig, ax = plt.subplots(figsize=FIGSIZE, dpi=DPI)
+    handles = []
+    for plot in PLOTS:
+        x, y = data[plot["data"]][plot["x"]], data[plot["data"]][plot["y"]]
+        mask = np.isfinite(x) & np.isfinite(y)
+        if not mask.all():
+            x, y = x[mask], y[mask]
+        if len(x) == 0:
+            continue
+        fitted = []
+        if plot["regression"] != "None":
+            if args.precomputed and plot["coefficients"] is not None:
+                result = plot["coefficients"], plot["r2"], plot["x_range"]
+            else:
+                result = fit(x, y, plot["regression"])
+            if result is not None:
+                coefficients, r2, x_range = result
+                x_fit, y_fit, formula = curve(plot["regression"], coefficients, x_range)
+                fitted = ax.plot(x_fit, y_fit, color=plot["regression_color"], linestyle="--", label=f"{plot['label']} ({REGRESSION_NAMES[plot['regression']]}: {formula}, R-squared = {r2:.5f})")
+        rasterized = args.rasterize and len(x) > RASTERIZE_POINTS
+        if plot["line"]:
+            handles += ax.plot(x, y, color=plot["color"], marker="o" if plot["markers"] else "None", label=plot["label"], rasterized=rasterized)
+        elif plot["markers"]:
+            ax.plot(x, y, color=plot["color"], linestyle="None", marker="o", zorder=1, rasterized=rasterized)
+            handles.append(ax.scatter([], [], color=plot["color"], label=plot["label"]))
+        handles += fitted
+    ax.grid(VIEW["grid"])
+    if handles:
+        ax.legend(handles=handles, loc=VIEW["legend"])
+    ax.set_xlabel(VIEW["x_label"])
+    ax.set_ylabel(VIEW["y_label"])
+    ax.set_title(VIEW["title"])
+    if not VIEW["autoscale"]:
+        ax.set_xlim(VIEW["xlim"])
+        ax.set_ylim(VIEW["ylim"])
+    if args.output:
+        fig.savefig(args.output)
+    else:
+        plt.show()
+
+if __name__ == "__main__":
+    main()
+'''
+
+def _regression_entry(plot, stats):
+    if plot.regression == "None" or not stats or stats.get("regression_type") != plot.regression:
+        return {"coefficients": None, "r2": None, "x_range": None}
+    coefficients = stats["coefficients"]
+    if plot.regression == "Exponential":
+        coefficients = (coefficients[1], coefficients[0])
+    return {
+        "coefficients": tuple(float(value) for value in coefficients),
+        "r2": float(stats["r2"]),
+        "x_range": tuple(float(value) for value in fit_range(stats))
+    }
+
+def _constant(name, value):
+    return f"{name} = {pprint.pformat(value, indent=1, width=120, sort_dicts=False)}"
+
+def export_script(datasets, plots, view, stats=None, figsize=FIGSIZE, dpi=DPI):
+    stats = stats or {}
+    plots = [plot for plot in plots if plot.visible and plot.dataset_id in datasets]
+    names = {dataset_id: f"data_{index}" for index, dataset_id in enumerate(dict.fromkeys(plot.dataset_id for plot in plots))}
+    files = {}
+    for plot in plots:
+        path, columns = files.setdefault(names[plot.dataset_id], (datasets[plot.dataset_id].path, []))
+        columns += [var for var in (plot.x_var, plot.y_var) if var not in columns]
+    entries = [dict({
+        "data": names[plot.dataset_id],
+        "x": plot.x_var,
+        "y": plot.y_var,
+        "label": plot.label,
+        "color": plot.main_color,
+        "line": plot.show_line,
+        "markers": plot.show_markers,
+        "regression": plot.regression,
+        "regression_color": plot.regression_color
+    }, **_regression_entry(plot, stats.get(plot))) for plot in plots]
+    view = {
+        "title": view.get("title", ""),
+        "x_label": view.get("x_label", ""),
+        "y_label": view.get("y_label", ""),
+        "grid": bool(view.get("grid", False)),
+        "legend": view.get("legend", "best"),
+        "autoscale": bool(view.get("autoscale", True)),
+        "xlim": tuple(float(value) for value in view.get("xlim", (0.0, 1.0))),
+        "ylim": tuple(float(value) for value in view.get("ylim", (0.0, 1.0)))
+    }
+    code = [
+        "# -*- coding: utf-8 -*-",
+        "import argparse",
+        "import numpy as np",
+        "import pandas as pd",
+        "",
+        _constant("CSV_OPTIONS", CSV_OPTIONS),
+        _constant("FILES", files),
+        _constant("PLOTS", entries),
+        _constant("VIEW", view),
+        _constant("REGRESSION_NAMES", REGRESSION_NAMES),
+        _constant("REGRESSION_POINTS", REGRESSION_POINTS),
+        _constant("RASTERIZE_POINTS", RASTERIZE_POINTS),
+        _constant("FIGSIZE", tuple(figsize)),
+        _constant("DPI", dpi)
+    ]
+    return "\n".join(code) + "\n" + SCRIPT_BODY
\ No newline at end of file
@@ -0,0 +1,74 @@
+import time
+from collections import deque
+from PyQt5.QtCore import QObject, QTimer
+from .profiling import profiler
+
+FRAME_INTERVAL_MS = 16
+FRAME_HISTORY = 240
+
+class FrameScheduler(QObject):
+    def __init__(self, canvas, registry, interval=FRAME_INTERVAL_MS, parent=None):
+        super().__init__(parent)
+        self.canvas = canvas
+        self.registry = registry
+        self.registry.scheduler = self
+        self.background = None
+        self.view_state = None
+        self.full = False
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(interval)
+        self.timer.timeout.connect(self.render_frame)
+        self.frame_times = deque(maxlen=FRAME_HISTORY)
+        self.frames = 0
+        self.blits = 0
+        self.canvas.mpl_connect('draw_event', self.on_draw)
+
+    def request(self, full=False):
+        self.full |= full
+        if not self.timer.isActive():
+            self.timer.start()
+
+    def view(self):
+        ax = self.registry.ax
+        return ax.get_xlim(), ax.get_ylim(), tuple(self.canvas.figure.bbox.bounds)
+
+    def render_frame(self):
+        start = time.perf_counter()
+        if self.full or self.background is None or self.view() != self.view_state:
+            with profiler.profile(), profiler.stage("draw"):
+                self.canvas.draw()
+        else:
+            with profiler.profile(), profiler.stage("blit"):
+                self.canvas.restore_region(self.background)
+                self.draw_artists()
+                self.canvas.blit(self.canvas.figure.bbox)
+            self.blits += 1
+        self.frames += 1
+        self.frame_times.append(time.perf_counter() - start)
+
+    def on_draw(self, event):
+        if self.canvas.is_saving():
+            return
+        self.timer.stop()
+        self.full = False
+        self.background = self.canvas.copy_from_bbox(self.canvas.figure.bbox)
+        self.view_state = self.view()
+        self.draw_artists()
+
+    def draw_artists(self):
+        ax = self.registry.ax
+        for artist in self.registry.artists():
+            if artist.get_animated():
+                ax.draw_artist(artist)
+
+    def stats(self):
+        times = [seconds * 1000 for seconds in self.frame_times]
+        return {
+            "frames": self.frames,
+            "blits": self.blits,
+            "last_ms": times[-1] if times else 0.0,
+            "mean_ms": sum(times) / len(times) if times else 0.0,
+            "max_ms": max(times, default=0.0),
+            "over_budget": sum(t > FRAME_INTERVAL_MS for t in times)
+        }
\ No newline at end of file
@@ -1,6 +1,51 @@
+import hashlib
+import threading
+from collections import OrderedDict
 import numpy as np
-import pandas as pd
-from sklearn.metrics import r2_score, mean_squared_error
+from .profiling import profiler
+
+_MISSING = object()
+ARRAY_KEYS = ("x", "y", "residuals")
+
+def _centered_sums(u, v):
+    u_mean = u.mean()
+    v_mean = v.mean()
+    buffer = np.subtract(u, u_mean)
+    suu = np.dot(buffer, buffer)
+    suv = np.dot(buffer, v)
+    np.subtract(v, v_mean, out=buffer)
+    return u_mean, v_mean, suu, suv, np.dot(buffer, buffer)
+
+def fit_least_squares(u, v):
+    u_mean, v_mean, suu, suv, svv = _centered_sums(u, v)
+    if not suu > 0:
+        raise np.linalg.LinAlgError("x values are constant")
+    slope = suv / suu
+    return slope, v_mean - slope * u_mean, suu, svv
+
+def r2_from_sums(ss_res, ss_tot):
+    if ss_tot > 0:
+        return 1 - ss_res / ss_tot
+    return 1.0 if ss_res == 0 else 0.0
+
+def _predict(u, slope, intercept, exponential=False, out=None):
+    y_pred = np.multiply(u, slope, out=out)
+    y_pred += intercept
+    if exponential:
+        np.exp(y_pred, out=y_pred)
+    return y_pred
+
+def _error_metrics(y, y_pred, ss_tot=None, keep_residuals=False):
+    residuals = np.subtract(y, y_pred, out=y_pred)
+    ss_res = np.dot(residuals, residuals)
+    buffer = np.abs(residuals, out=None if keep_residuals else residuals)
+    mae = buffer.mean()
+    if ss_tot is None:
+        np.subtract(y, y.mean(), out=buffer)
+        ss_tot = np.dot(buffer, buffer)
+    r2 = r2_from_sums(ss_res, ss_tot)
+    rmse = np.sqrt(ss_res / len(y))
+    return residuals, ss_res, r2, rmse, mae
 
 def calculate_regression_stats(x, y, regression_type):
     stats = {
@@ -8,20 +53,15 @@ def calculate_regression_stats(x, y, regression_type):
         "y": y,
         "regression_type": regression_type
     }
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
     if regression_type == "Linear":
-        z = np.polyfit(x, y, 1)
-        p = np.poly1d(z)
-        y_pred = p(x)
+        m, b, sxx, syy = fit_least_squares(x, y)
         n = len(x)
-        m, b = z[0], z[1]
-        residuals = y - y_pred
-        se = np.sqrt(np.sum(residuals**2) / (n - 2))
-        x_mean = np.mean(x)
-        stderr_slope = se / np.sqrt(np.sum((x - x_mean)**2))
-        r2 = r2_score(y, y_pred)
+        residuals, ss_res, r2, rmse, mae = _error_metrics(y, _predict(x, m, b), syy, keep_residuals=True)
+        se = np.sqrt(ss_res / (n - 2))
+        stderr_slope = se / np.sqrt(sxx)
         adj_r2 = 1 - (1 - r2) * (n - 1) / (n - 2)
-        rmse = np.sqrt(mean_squared_error(y, y_pred))
-        mae = np.mean(np.abs(residuals))
         stats.update({
             "coefficients": (m, b),
             "residuals": residuals,
@@ -38,35 +78,403 @@ def calculate_regression_stats(x, y, regression_type):
         x_clean, y_clean = x[mask], y[mask]
         if len(x_clean) < 2:
             return None
-        z = np.polyfit(x_clean, np.log(y_clean), 1)
-        p = np.poly1d(z)
-        y_pred = np.exp(p(x_clean))
-        r2 = r2_score(y_clean, y_pred)
-        rmse = np.sqrt(mean_squared_error(y_clean, y_pred))
-        mae = np.mean(np.abs(y_clean - y_pred))
+        rate, log_amplitude, _, _ = fit_least_squares(x_clean, np.log(y_clean))
+        _, _, r2, rmse, mae = _error_metrics(y_clean, _predict(x_clean, rate, log_amplitude, exponential=True))
         stats.update({
-            "coefficients": (z[1], z[0]),
+            "coefficients": (log_amplitude, rate),
             "r2": r2,
             "rmse": rmse,
             "mae": mae,
-            "formula": f"y = {np.exp(z[1]):.6f} * e^({z[0]:.6f}x)"
+            "formula": f"y = {np.exp(log_amplitude):.6f} * e^({rate:.6f}x)"
         })
     elif regression_type == "Logarithmic":
         mask = x > 0
         x_clean, y_clean = x[mask], y[mask]
         if len(x_clean) < 2:
             return None
-        z = np.polyfit(np.log(x_clean), y_clean, 1)
-        p = np.poly1d(z)
-        y_pred = p(np.log(x_clean))
-        r2 = r2_score(y_clean, y_pred)
-        rmse = np.sqrt(mean_squared_error(y_clean, y_pred))
-        mae = np.mean(np.abs(y_clean - y_pred))
+        log_x = np.log(x_clean)
+        m, b, _, syy = fit_least_squares(log_x, y_clean)
+        _, _, r2, rmse, mae = _error_metrics(y_clean, _predict(log_x, m, b, out=log_x), syy)
         stats.update({
-            "coefficients": (z[0], z[1]),
+            "coefficients": (m, b),
             "r2": r2,
             "rmse": rmse,
             "mae": mae,
-            "formula": f"y = {z[0]:.6f} * ln(x) + {z[1]:.6f}"
+            "formula": f"y = {m:.6f} * ln(x) + {b:.6f}"
+        })
+    return stats
+
+class RunningRegression:
+    def __init__(self, regression_type):
+        self.regression_type = regression_type
+        self.clear()
+
+    def clear(self):
+        self.n = 0
+        self.means = np.zeros(2)
+        self.sums = np.zeros(3)
+        self.removed = 0
+
+    def clean(self, x, y):
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        mask = np.isfinite(x) & np.isfinite(y)
+        if self.regression_type == "Exponential":
+            mask &= y > 0
+        elif self.regression_type == "Logarithmic":
+            mask &= x > 0
+        return (x, y) if mask.all() else (x[mask], y[mask])
+
+    def _moments(self, x, y):
+        u, v = self.clean(x, y)
+        if len(u) == 0:
+            return None
+        if self.regression_type == "Exponential":
+            v = np.log(v)
+        elif self.regression_type == "Logarithmic":
+            u = np.log(u)
+        u_mean, v_mean, suu, suv, svv = _centered_sums(u, v)
+        return len(u), np.array([u_mean, v_mean]), np.array([suu, suv, svv])
+
+    def add(self, x, y):
+        moments = self._moments(x, y)
+        if moments is None:
+            return
+        n, means, sums = moments
+        total = self.n + n
+        delta = means - self.means
+        self.sums += sums + np.array([delta[0] * delta[0], delta[0] * delta[1], delta[1] * delta[1]]) * (self.n * n / total)
+        self.means += delta * (n / total)
+        self.n = total
+
+    def remove(self, x, y):
+        moments = self._moments(x, y)
+        if moments is None:
+            return
+        n, means, sums = moments
+        rest = self.n - n
+        if rest <= 0:
+            self.clear()
+            return
+        rest_means = (self.n * self.means - n * means) / rest
+        delta = means - rest_means
+        self.sums -= sums + np.array([delta[0] * delta[0], delta[0] * delta[1], delta[1] * delta[1]]) * (rest * n / self.n)
+        self.sums[[0, 2]] = np.maximum(self.sums[[0, 2]], 0.0)
+        self.means = rest_means
+        self.n = rest
+        self.removed += n
+
+    def rebuild(self, x, y):
+        self.clear()
+        self.add(x, y)
+
+    def coefficients(self):
+        slope = self.sums[1] / self.sums[0]
+        return slope, self.means[1] - slope * self.means[0]
+
+    def predict(self, x):
+        slope, intercept = self.coefficients()
+        if self.regression_type == "Logarithmic":
+            x = np.log(x)
+        return _predict(x, slope, intercept, self.regression_type == "Exponential")
+
+    def stats(self, x=None, y=None):
+        suu, suv, svv = self.sums
+        if self.n < 2 or not suu > 0:
+            return None
+        slope, intercept = self.coefficients()
+        ss_res = max(svv - slope * suv, 0.0)
+        r2 = r2_from_sums(ss_res, svv)
+        stats = {
+            "x": x,
+            "y": y,
+            "regression_type": self.regression_type,
+            "coefficients": (slope, intercept),
+            "r2": r2,
+            "rmse": np.sqrt(ss_res / self.n)
+        }
+        if self.regression_type == "Linear":
+            stats["formula"] = f"y = {slope:.6f}x + {intercept:.6f}"
+            if self.n > 2:
+                stats["se"] = np.sqrt(ss_res / (self.n - 2))
+                stats["stderr_slope"] = stats["se"] / np.sqrt(suu)
+                stats["adj_r2"] = 1 - (1 - r2) * (self.n - 1) / (self.n - 2)
+        elif self.regression_type == "Exponential":
+            stats["coefficients"] = (intercept, slope)
+            stats["formula"] = f"y = {np.exp(intercept):.6f} * e^({slope:.6f}x)"
+        else:
+            stats["formula"] = f"y = {slope:.6f} * ln(x) + {intercept:.6f}"
+        if x is not None:
+            x, y = self.clean(x, y)
+            y_pred = self.predict(x)
+            if self.regression_type == "Exponential":
+                residuals, _, stats["r2"], stats["rmse"], stats["mae"] = _error_metrics(y, y_pred)
+            else:
+                residuals, _, _, _, stats["mae"] = _error_metrics(y, y_pred, svv, self.regression_type == "Linear")
+            if self.regression_type == "Linear":
+                stats["residuals"] = residuals
+            stats["x"], stats["y"] = x, y
+        return stats
+
+BATCH_BLOCK_ELEMENTS = 1 << 16
+BATCH_METRICS = ("slope", "intercept", "se", "stderr_slope", "r2", "adj_r2", "rmse", "mae")
+
+def _row_dots(a, b):
+    return np.einsum('ij,ij->i', a, b)
+
+def _fit_rows(y, u, basis, u_finite, regression_type):
+    mask = np.isfinite(y)
+    mask &= u_finite
+    if regression_type == "Exponential":
+        np.greater(y, 0, out=mask, where=mask)
+    complete = mask.all()
+    if complete:
+        n = np.full(len(y), len(u))
+        u_sum = np.full(len(y), u.sum())
+        uu_sum = np.full(len(y), np.dot(u, u))
+    else:
+        weights = mask.astype(np.float64)
+        y[~mask] = 1.0 if regression_type == "Exponential" else 0.0
+        n = mask.sum(axis=1)
+        u_sum = weights @ u
+        uu_sum = weights @ (u * u)
+    v = np.log(y) if regression_type == "Exponential" else y
+    v_sum, uv_sum = (v @ basis).T
+    u_mean = u_sum / n
+    v_mean = v_sum / n
+    suu = uu_sum - u_sum * u_mean
+    slope = (uv_sum - v_mean * u_sum) / suu
+    intercept = v_mean - slope * u_mean
+    residuals = np.multiply.outer(slope, u)
+    residuals += intercept[:, None]
+    if regression_type == "Exponential":
+        np.exp(residuals, out=residuals)
+        np.subtract(y, residuals, out=residuals)
+        y_mean = (y.sum(axis=1) if complete else _row_dots(y, weights)) / n
+        dy = y - y_mean[:, None]
+        if not complete:
+            dy *= weights
+        ss_tot = _row_dots(dy, dy)
+    else:
+        np.subtract(v, residuals, out=residuals)
+    if not complete:
+        residuals *= weights
+    ss_res = _row_dots(residuals, residuals)
+    if regression_type != "Exponential":
+        ss_tot = ss_res + slope * slope * suu
+    np.abs(residuals, out=residuals)
+    mae = residuals.sum(axis=1) / n
+    return n, suu, slope, intercept, ss_res, ss_tot, mae
+
+def calculate_regression_stats_batch(x, y, regression_types):
+    x = np.asarray(x, dtype=np.float64)
+    rows = np.asarray(y, dtype=np.float64).T
+    regression_types = np.asarray(regression_types)
+    batch = {metric: np.full(len(regression_types), np.nan) for metric in BATCH_METRICS}
+    batch["n"] = np.zeros(len(regression_types), dtype=np.int64)
+    batch["valid"] = np.zeros(len(regression_types), dtype=bool)
+    batch["regression_type"] = regression_types
+    x_finite = np.isfinite(x)
+    log_finite = x_finite & (x > 0)
+    block = max(1, BATCH_BLOCK_ELEMENTS // max(len(x), 1))
+    with np.errstate(invalid='ignore', divide='ignore'):
+        for regression_type in ("Linear", "Exponential", "Logarithmic"):
+            columns = np.flatnonzero(regression_types == regression_type)
+            if len(columns) == 0:
+                continue
+            values, finite = (np.log(x), log_finite) if regression_type == "Logarithmic" else (x, x_finite)
+            shift = values[finite].mean() if finite.any() else 0.0
+            u = np.where(finite, values - shift, 0.0)
+            basis = np.column_stack((np.ones_like(u), u))
+            for start in range(0, len(columns), block):
+                selected = columns[start:start + block]
+                n, suu, slope, intercept, ss_res, ss_tot, mae = _fit_rows(rows[selected], u, basis, finite, regression_type)
+                r2 = np.where(ss_tot > 0, 1 - ss_res / ss_tot, np.where(ss_res == 0, 1.0, 0.0))
+                batch["n"][selected] = n
+                batch["valid"][selected] = (n >= 2) & (suu > 0)
+                batch["slope"][selected] = slope
+                batch["intercept"][selected] = intercept - slope * shift
+                batch["r2"][selected] = r2
+                batch["rmse"][selected] = np.sqrt(ss_res / n)
+                batch["mae"][selected] = mae
+                if regression_type == "Linear":
+                    se = np.sqrt(ss_res / (n - 2))
+                    batch["se"][selected] = se
+                    batch["stderr_slope"][selected] = se / np.sqrt(suu)
+                    batch["adj_r2"][selected] = 1 - (1 - r2) * (n - 1) / (n - 2)
+    return batch
+
+def unpack_regression_batch(batch, column, x, y):
+    regression_type = str(batch["regression_type"][column])
+    if not batch["valid"][column]:
+        if batch["n"][column] >= 2:
+            raise np.linalg.LinAlgError("x values are constant")
+        return None
+    slope = batch["slope"][column]
+    intercept = batch["intercept"][column]
+    stats = {
+        "x": x,
+        "y": y,
+        "regression_type": regression_type,
+        "r2": batch["r2"][column],
+        "rmse": batch["rmse"][column],
+        "mae": batch["mae"][column]
+    }
+    if regression_type == "Linear":
+        stats.update({
+            "coefficients": (slope, intercept),
+            "residuals": y - (slope * x + intercept),
+            "se": batch["se"][column],
+            "stderr_slope": batch["stderr_slope"][column],
+            "adj_r2": batch["adj_r2"][column],
+            "formula": f"y = {slope:.6f}x + {intercept:.6f}"
         })
-    return stats 
\ No newline at end of file
+    elif regression_type == "Exponential":
+        stats.update({
+            "coefficients": (intercept, slope),
+            "formula": f"y = {np.exp(intercept):.6f} * e^({slope:.6f}x)"
+        })
+    else:
+        stats.update({
+            "coefficients": (slope, intercept),
+            "formula": f"y = {slope:.6f} * ln(x) + {intercept:.6f}"
+        })
+    return stats
+
+def data_fingerprint(*arrays):
+    digest = hashlib.blake2b(digest_size=16)
+    for array in arrays:
+        array = np.ascontiguousarray(array)
+        digest.update(f"{array.dtype.str}{array.shape}".encode())
+        digest.update(memoryview(array).cast("B"))
+    return digest.hexdigest()
+
+def scalar_stats(stats):
+    if not stats:
+        return stats
+    return {key: value for key, value in stats.items() if key not in ARRAY_KEYS}
+
+def attach_arrays(stats, x, y):
+    if not stats:
+        return stats
+    stats = dict(stats, x=x, y=y)
+    if stats["regression_type"] == "Linear":
+        m, b = stats["coefficients"]
+        stats["residuals"] = y - (m * x + b)
+    return stats
+
+class RegressionCache:
+    def __init__(self, max_entries=1024):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key, stats):
+        stats = scalar_stats(stats)
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = stats
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+regression_cache = RegressionCache()
+
+def cached_regression_stats(x, y, regression_type, key=None, cache=None):
+    cache = regression_cache if cache is None else cache
+    if key is None:
+        key = (data_fingerprint(x, y), regression_type)
+    stats = cache.get(key, _MISSING)
+    if stats is _MISSING:
+        stats = calculate_regression_stats(x, y, regression_type)
+        cache.put(key, stats)
+        return stats
+    return attach_arrays(stats, x, y)
+
+def prepare_series(dataset, x_var, y_var, regression_type, key=None, xy=None, progress=None):
+    label = f"{y_var} vs {x_var}"
+    if xy is None:
+        x = dataset.column(x_var)
+        y = dataset.column(y_var)
+        with profiler.stage("mask", label):
+            mask = np.isfinite(x) & np.isfinite(y)
+            xy = (x, y) if mask.all() else (x[mask], y[mask])
+    x, y = xy
+    stats = error = None
+    if regression_type != "None" and len(x) > 0:
+        if progress is not None:
+            progress(0.5)
+        try:
+            with profiler.stage("regression", f"{label} {regression_type}"):
+                stats = cached_regression_stats(x, y, regression_type, key=key)
+        except Exception as e:
+            error = e
+    if progress is not None:
+        progress(1.0)
+    return x, y, stats, error
+
+def prepare_series_batch(dataset, x_var, y_vars, regression_types, keys=None, progress=None, cache=None):
+    cache = regression_cache if cache is None else cache
+    keys = keys or [None] * len(y_vars)
+    x_full = dataset.column(x_var)
+    x_finite = np.isfinite(x_full)
+    results = []
+    pending = []
+    masked = {}
+    for column, (y_var, regression_type, key) in enumerate(zip(y_vars, regression_types, keys)):
+        if progress is not None:
+            progress(column / (2 * len(y_vars)))
+        if y_var not in masked:
+            y_full = dataset.column(y_var)
+            with profiler.stage("mask", f"{y_var} vs {x_var}"):
+                mask = x_finite & np.isfinite(y_full)
+                masked[y_var] = (x_full, y_full) if mask.all() else (x_full[mask], y_full[mask])
+        x, y = masked[y_var]
+        stats = _MISSING
+        if regression_type == "None" or len(x) == 0:
+            stats = None
+        elif key is not None:
+            stats = cache.get(key, _MISSING)
+            if stats is not _MISSING:
+                stats = attach_arrays(stats, x, y)
+        if stats is _MISSING:
+            pending.append(column)
+        results.append([x, y, stats, None])
+    if pending:
+        with profiler.stage("regression", f"{len(pending)} series vs {x_var}"):
+            y_matrix = np.vstack([dataset.column(y_vars[column]) for column in pending]).T
+            batch = calculate_regression_stats_batch(x_full, y_matrix, [regression_types[column] for column in pending])
+        for index, column in enumerate(pending):
+            if progress is not None:
+                progress(0.5 + index / (2 * len(pending)))
+            x, y = results[column][:2]
+            try:
+                results[column][2] = unpack_regression_batch(batch, index, x, y)
+                if keys[column] is not None:
+                    cache.put(keys[column], results[column][2])
+            except Exception as e:
+                results[column][2] = None
+                results[column][3] = e
+    return [tuple(result) for result in results]
\ No newline at end of file
@@ -0,0 +1,192 @@
+import numpy as np
+from .dataset import CHUNK_ROWS, iter_chunks, to_array
+from .logic import RunningRegression, r2_from_sums
+from .profiling import profiler
+
+MAX_BINS = 1 << 16
+_EMPTY_BIN = np.array([np.inf, -np.inf, 0.0, 0.0])
+
+def _merge_bins(a, b):
+    return np.vstack((np.minimum(a[0], b[0]), np.maximum(a[1], b[1]), a[2] + b[2], a[3] + b[3]))
+
+def _bin_values(values, starts):
+    finite = np.isfinite(values)
+    return np.vstack((
+        np.minimum.reduceat(np.where(finite, values, np.inf), starts),
+        np.maximum.reduceat(np.where(finite, values, -np.inf), starts),
+        np.add.reduceat(np.where(finite, values, 0.0), starts),
+        np.add.reduceat(finite.astype(np.float64), starts)
+    ))
+
+def _halve(bins):
+    if bins.shape[1] % 2:
+        bins = np.column_stack((bins, _EMPTY_BIN))
+    return _merge_bins(bins[:, 0::2], bins[:, 1::2])
+
+class BinPyramid:
+    def __init__(self, columns, max_bins=MAX_BINS):
+        self.max_bins = max_bins
+        self.rows_per_bin = 1
+        self.n_rows = 0
+        self.n_bins = 0
+        self.bins = {col: np.empty((4, max_bins)) for col in columns}
+        self.levels = []
+
+    def add(self, arrays):
+        rows = len(next(iter(arrays.values())))
+        if rows == 0:
+            return
+        while (self.n_rows + rows - 1) // self.rows_per_bin >= self.max_bins:
+            self._coarsen()
+        index = np.arange(self.n_rows, self.n_rows + rows) // self.rows_per_bin
+        starts = np.flatnonzero(np.r_[True, index[1:] != index[:-1]])
+        first, last = index[0], index[-1]
+        for col, values in arrays.items():
+            binned = _bin_values(values, starts)
+            target = self.bins[col]
+            if first < self.n_bins:
+                target[:, first] = _merge_bins(target[:, first:first + 1], binned[:, :1])[:, 0]
+                target[:, first + 1:last + 1] = binned[:, 1:]
+            else:
+                target[:, first:last + 1] = binned
+        self.n_bins = last + 1
+        self.n_rows += rows
+        self.levels = []
+
+    def _coarsen(self):
+        for col, target in self.bins.items():
+            halved = _halve(target[:, :self.n_bins])
+            target[:, :halved.shape[1]] = halved
+        self.n_bins = (self.n_bins + 1) // 2
+        self.rows_per_bin *= 2
+
+    def finish(self):
+        level = {col: target[:, :self.n_bins].copy() for col, target in self.bins.items()}
+        self.levels = [level]
+        while next(iter(level.values())).shape[1] > 1:
+            level = {col: _halve(bins) for col, bins in level.items()}
+            self.levels.append(level)
+        return self
+
+    def series(self, x_var, y_var):
+        return BinnedSeries(self, x_var, y_var)
+
+class BinnedSeries:
+    def __init__(self, pyramid, x_var, y_var):
+        self.pyramid = pyramid
+        self.x_var = x_var
+        self.y_var = y_var
+
+    def __len__(self):
+        if not self.pyramid.levels:
+            return 0
+        base = self.pyramid.levels[0]
+        return int(min(base[self.x_var][3].sum(), base[self.y_var][3].sum()))
+
+    def decimate(self, kind, x_range, y_range, width, height):
+        lo, hi = x_range
+        for level in self.pyramid.levels:
+            xs, ys = level[self.x_var], level[self.y_var]
+            valid = (xs[3] > 0) & (ys[3] > 0)
+            inside = valid & (xs[1] >= lo) & (xs[0] <= hi)
+            if np.count_nonzero(inside) <= 2 * width:
+                break
+        keep = inside.copy()
+        keep[1:] |= inside[:-1]
+        keep[:-1] |= inside[1:]
+        idx = np.flatnonzero(keep & valid)
+        x_mean = xs[2, idx] / xs[3, idx]
+        return np.repeat(x_mean, 2), np.column_stack((ys[0, idx], ys[1, idx])).ravel()
+
+    def ranges(self):
+        base = self.pyramid.levels[0]
+        xs, ys = base[self.x_var], base[self.y_var]
+        if not len(self):
+            return (0.0, 1.0), (0.0, 1.0)
+        return (float(xs[0].min()), float(xs[1].max())), (float(ys[0].min()), float(ys[1].max()))
+
+class _SeriesStats:
+    def __init__(self, regression_type):
+        self.fit = RunningRegression(regression_type)
+        self.summary = RunningRegression("Linear")
+        self.x_range = [np.inf, -np.inf]
+        self.ss_res = 0.0
+        self.abs_res = 0.0
+        self.y_moments = RunningRegression("Linear")
+
+    def add(self, x, y):
+        self.summary.add(x, y)
+        x, y = self.fit.clean(x, y)
+        if len(x):
+            self.x_range = [min(self.x_range[0], x.min()), max(self.x_range[1], x.max())]
+        self.fit.add(x, y)
+
+    def add_residuals(self, x, y):
+        x, y = self.fit.clean(x, y)
+        residuals = y - self.fit.predict(x)
+        self.ss_res += np.dot(residuals, residuals)
+        self.abs_res += np.abs(residuals).sum()
+        if self.fit.regression_type == "Exponential":
+            self.y_moments.add(x, y)
+
+    def ready(self):
+        return self.fit.n >= 2 and self.fit.sums[0] > 0
+
+    def result(self):
+        if self.fit.n == 0:
+            return None
+        if not self.ready():
+            if self.fit.regression_type == "Linear" or self.fit.n >= 2:
+                raise np.linalg.LinAlgError("x values are constant")
+            return None
+        stats = self.fit.stats()
+        n = self.fit.n
+        stats["mae"] = self.abs_res / n
+        if self.fit.regression_type == "Exponential":
+            stats["r2"] = r2_from_sums(self.ss_res, self.y_moments.sums[2])
+            stats["rmse"] = np.sqrt(self.ss_res / n)
+        summary = self.summary
+        stats["x_range"] = tuple(self.x_range)
+        stats["summary"] = (summary.n, summary.means[0], summary.means[1], np.sqrt(summary.sums[0] / summary.n), np.sqrt(summary.sums[2] / summary.n))
+        return stats
+
+def _read_columns(path, columns, chunk_rows, progress):
+    for chunk in iter_chunks(path, columns, chunk_rows, progress):
+        arrays = {}
+        for col in columns:
+            with profiler.stage("coerce", col):
+                arrays[col] = to_array(chunk[col])
+        yield arrays
+
+def stream_series(path, plots, progress=None, chunk_rows=CHUNK_ROWS):
+    columns = list(dict.fromkeys(var for x_var, y_var, _ in plots for var in (x_var, y_var)))
+    pyramid = BinPyramid(columns)
+    trackers = [_SeriesStats(regression_type) if regression_type != "None" else None for _, _, regression_type in plots]
+    passes = 2 if any(trackers) else 1
+    first_pass = (lambda fraction: progress(fraction / passes)) if progress is not None else None
+    for arrays in _read_columns(path, columns, chunk_rows, first_pass):
+        with profiler.stage("bin"):
+            pyramid.add(arrays)
+        for (x_var, y_var, _), tracker in zip(plots, trackers):
+            if tracker is not None:
+                with profiler.stage("regression", f"{y_var} vs {x_var}"):
+                    tracker.add(arrays[x_var], arrays[y_var])
+    pyramid.finish()
+    if passes == 2:
+        second_pass = (lambda fraction: progress((1 + fraction) / passes)) if progress is not None else None
+        for arrays in _read_columns(path, columns, chunk_rows, second_pass):
+            for (x_var, y_var, _), tracker in zip(plots, trackers):
+                if tracker is not None and tracker.ready():
+                    with profiler.stage("residuals", f"{y_var} vs {x_var}"):
+                        tracker.add_residuals(arrays[x_var], arrays[y_var])
+    results = []
+    for (x_var, y_var, _), tracker in zip(plots, trackers):
+        series = pyramid.series(x_var, y_var)
+        stats = error = None
+        if tracker is not None and len(series) > 0:
+            try:
+                stats = tracker.result()
+            except Exception as e:
+                error = e
+        results.append((series, series, stats, error))
+    return results
\ No newline at end of file
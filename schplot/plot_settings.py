@@ -1,10 +1,24 @@
 class PlotSettings:
     def __init__(self):
+        self.dataset_id = ""
         self.x_var = ""
         self.y_var = ""
         self.show_line = False
         self.show_markers = True
+        self.visible = True
         self.regression = "None"
         self.label = ""
         self.main_color = "Blue"
-        self.regression_color = "Red" 
\ No newline at end of file
+        self.regression_color = "Red" 
+
+    def to_dict(self):
+        return dict(vars(self))
+
+    @classmethod
+    def from_dict(cls, data):
+        plot = cls()
+        for key, value in data.items():
+            if not hasattr(plot, key):
+                raise ValueError(f"Unknown plot setting: {key}")
+            setattr(plot, key, value)
+        return plot
\ No newline at end of file
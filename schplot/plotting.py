@@ -0,0 +1,279 @@
+import numpy as np
+from matplotlib.transforms import Bbox
+from .decimation import decimate_line, decimate_scatter, data_range
+
+REGRESSION_POINTS = 512
+REGRESSION_NAMES = {"Linear": "Linear", "Exponential": "Exp", "Logarithmic": "Log"}
+
+def fit_range(stats):
+    if "x_range" in stats:
+        return stats["x_range"]
+    x, y = stats["x"], stats["y"]
+    if stats["regression_type"] == "Exponential":
+        return data_range(x[y > 0])
+    if stats["regression_type"] == "Logarithmic":
+        return data_range(x[x > 0])
+    return data_range(x)
+
+def regression_curve(stats):
+    coefficients = stats["coefficients"]
+    x_fit = np.linspace(*fit_range(stats), REGRESSION_POINTS)
+    if stats["regression_type"] == "Linear":
+        return x_fit, np.poly1d(coefficients)(x_fit)
+    if stats["regression_type"] == "Exponential":
+        return x_fit, np.exp(np.poly1d((coefficients[1], coefficients[0]))(x_fit))
+    return x_fit, np.poly1d(coefficients)(np.log(x_fit))
+
+def regression_label(label, stats):
+    name = REGRESSION_NAMES[stats["regression_type"]]
+    return f"{label} ({name}: {stats['formula']}, R-squared = {stats['r2']:.5f})"
+
+def series_warnings(plot, result):
+    x, y, stats, error = result
+    if len(x) == 0 or len(y) == 0:
+        return [("Data Error", f"No valid data points for {plot.label}")]
+    if isinstance(error, np.linalg.LinAlgError):
+        return [("Regression Error", f"Could not perform regression for {plot.label}. The data might be constant or have other issues.")]
+    if error is not None:
+        return [("Error", f"An error occurred while processing {plot.label}: {str(error)}")]
+    return []
+
+def series_kind(plot):
+    if plot.show_line:
+        return "line"
+    if plot.show_markers:
+        return "scatter"
+    return None
+
+class SeriesArtists:
+    def __init__(self, registry):
+        self.registry = registry
+        self.data_key = None
+        self.regression_key = None
+        self.x = None
+        self.y = None
+        self.kind = None
+        self.artist = None
+        self.regression_artist = None
+        self.stats = None
+        self.visible = True
+        self.drawn_view = None
+
+    def set_data(self, key, x, y):
+        self.remove()
+        self.data_key = key
+        self.x = x
+        self.y = y
+
+    def replace_data(self, x, y):
+        self.x = x
+        self.y = y
+        self.redraw(force=True)
+
+    def load_result(self, plot, result):
+        x, y, stats, error = result
+        data_key = (plot.dataset_id, plot.x_var, plot.y_var)
+        if self.data_key != data_key:
+            if len(x) == 0 or len(y) == 0:
+                self.set_data(None, None, None)
+                return False
+            self.set_data(data_key, x, y)
+        self.set_regression((plot.dataset_id, plot.x_var, plot.y_var, plot.regression), stats)
+        return True
+
+    def show(self, plot):
+        self.set_visible(plot.visible)
+        kind_changed = self.kind != series_kind(plot)
+        self.apply_style(plot)
+        self.apply_regression_style(plot)
+        return kind_changed
+
+    def remove(self):
+        self.remove_artist()
+        self.set_regression(None, None)
+
+    def remove_artist(self):
+        if self.artist is not None:
+            self.artist.remove()
+        self.artist = None
+        self.kind = None
+        self.drawn_view = None
+
+    def apply_style(self, plot):
+        kind = series_kind(plot)
+        if kind != self.kind:
+            self.remove_artist()
+            self.kind = kind
+            if kind is not None:
+                x_draw, y_draw = self.decimated()
+                ax = self.registry.ax
+                if kind == "line":
+                    self.artist, = ax.plot(x_draw, y_draw)
+                else:
+                    self.artist = ax.scatter(x_draw, y_draw)
+                self.artist.set_animated(self.registry.scheduler is not None)
+        if self.artist is None:
+            return
+        self.artist.set_color(plot.main_color)
+        self.artist.set_label(plot.label)
+        self.artist.set_visible(self.visible)
+        if kind == "line":
+            self.artist.set_marker('o' if plot.show_markers else 'None')
+
+    def set_regression(self, key, stats):
+        if self.regression_artist is not None:
+            self.regression_artist.remove()
+        self.regression_artist = None
+        self.regression_key = key
+        self.stats = stats
+        if stats:
+            x_fit, y_fit = regression_curve(stats)
+            self.regression_artist, = self.registry.ax.plot(x_fit, y_fit, linestyle='--')
+            self.regression_artist.set_animated(self.registry.scheduler is not None)
+
+    def update_regression(self, plot, stats):
+        if self.regression_artist is None:
+            self.set_regression(self.regression_key, stats)
+        else:
+            self.stats = stats
+            self.regression_artist.set_data(*regression_curve(stats))
+        self.apply_regression_style(plot)
+
+    def apply_regression_style(self, plot):
+        if self.regression_artist is None:
+            return
+        self.regression_artist.set_color(plot.regression_color)
+        self.regression_artist.set_label(regression_label(plot.label, self.stats))
+        self.regression_artist.set_visible(self.visible)
+
+    def set_visible(self, visible):
+        self.visible = visible
+        for artist in self.handles():
+            artist.set_visible(visible)
+
+    def decimated(self):
+        self.drawn_view = self.registry.view_key(self.kind)
+        return self.registry.decimate(self.kind, self.x, self.y)
+
+    def redraw(self, force=False):
+        if self.artist is None:
+            return
+        if not force and self.drawn_view == self.registry.view_key(self.kind):
+            return
+        x_draw, y_draw = self.decimated()
+        if self.kind == "line":
+            self.artist.set_data(x_draw, y_draw)
+        else:
+            self.artist.set_offsets(np.column_stack((x_draw, y_draw)))
+
+    def handles(self):
+        return [artist for artist in (self.artist, self.regression_artist) if artist is not None]
+
+    def extent(self):
+        points = []
+        if self.artist is not None:
+            points.append(self.x.ranges() if hasattr(self.x, "ranges") else (data_range(self.x), data_range(self.y)))
+        if self.regression_artist is not None:
+            x_fit, y_fit = self.regression_artist.get_data()
+            points.append((data_range(x_fit), data_range(y_fit)))
+        return [((x0, y0), (x1, y1)) for (x0, x1), (y0, y1) in points]
+
+class ArtistRegistry:
+    def __init__(self, ax, interactive=True):
+        self.ax = ax
+        self.interactive = interactive
+        self.scheduler = None
+        self.entries = {}
+        self.connect()
+
+    def connect(self):
+        self.ax.callbacks.connect('xlim_changed', self.refresh)
+        self.ax.callbacks.connect('ylim_changed', self.refresh)
+
+    def clear(self):
+        self.ax.clear()
+        self.entries = {}
+        self.connect()
+
+    def entry(self, plot):
+        if plot not in self.entries:
+            self.entries[plot] = SeriesArtists(self)
+        return self.entries[plot]
+
+    def prune(self, plots):
+        removed = [plot for plot in self.entries if plot not in plots]
+        for plot in removed:
+            self.entries.pop(plot).remove()
+        return bool(removed)
+
+    def view(self):
+        x_range = tuple(sorted(self.ax.get_xlim()))
+        y_range = tuple(sorted(self.ax.get_ylim()))
+        width = max(int(self.ax.bbox.width), 1)
+        height = max(int(self.ax.bbox.height), 1)
+        return x_range, y_range, width, height
+
+    def view_key(self, kind):
+        x_range, y_range, width, height = self.view()
+        return (x_range, width) if kind == "line" else (x_range, y_range, width, height)
+
+    def decimate(self, kind, x, y):
+        x_range, y_range, width, height = self.view()
+        if hasattr(x, "decimate"):
+            return x.decimate(kind, x_range, y_range, width, height)
+        if kind == "line":
+            return decimate_line(x, y, x_range, width)
+        return decimate_scatter(x, y, x_range, y_range, width, height)
+
+    def refresh(self, *args):
+        if not self.entries:
+            return
+        for entry in self.entries.values():
+            entry.redraw()
+        if self.scheduler is not None:
+            self.scheduler.request()
+        elif self.interactive:
+            self.ax.figure.canvas.draw_idle()
+
+    def autoscale(self):
+        self.ax.dataLim.ignore(True)
+        self.ax.dataLim.set_points(Bbox.null().get_points())
+        self.ax.ignore_existing_data_limits = True
+        for entry in self.entries.values():
+            if entry.visible:
+                for corners in entry.extent():
+                    self.ax.update_datalim(corners)
+        self.ax.autoscale(True)
+
+    def artists(self):
+        return [artist for entry in self.entries.values() if entry.visible for artist in entry.handles()]
+
+    def update_legend(self):
+        handles = self.artists()
+        legend = self.ax.get_legend()
+        if legend is not None:
+            legend.remove()
+        if handles:
+            legend = self.ax.legend(handles=handles)
+            for handle in legend.legend_handles:
+                handle.set_animated(False)
+
+def legend_location(ax):
+    legend = ax.get_legend()
+    if legend is None or legend.get_window_extent().width == 0:
+        return "best"
+    (x0, y0), (x1, y1) = ax.transAxes.inverted().transform(legend.get_window_extent())
+    def side(low_gap, high_gap, low, high):
+        if abs(low_gap - high_gap) < 1e-3:
+            return "center"
+        return low if low_gap < high_gap else high
+    vertical = side(y0, 1 - y1, "lower", "upper")
+    horizontal = side(x0, 1 - x1, "left", "right")
+    return "center" if vertical == horizontal == "center" else f"{vertical} {horizontal}"
+
+def decorate_axes(ax, registry, title="", x_label="", y_label="", grid=False):
+    ax.grid(grid)
+    registry.update_legend()
+    ax.set_xlabel(x_label)
+    ax.set_ylabel(y_label)
+    ax.set_title(title)
\ No newline at end of file
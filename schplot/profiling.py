@@ -0,0 +1,161 @@
+import contextlib
+import cProfile
+import pstats
+import sys
+import threading
+import time
+import tracemalloc
+
+_NULL = contextlib.nullcontext()
+PROCESS_WIDE_PROFILE = sys.version_info >= (3, 12)
+
+class _Stage:
+    def __init__(self, profiler, name, label):
+        self.profiler = profiler
+        self.name = name
+        self.label = label
+
+    def __enter__(self):
+        self.memory = tracemalloc.get_traced_memory()[0] if tracemalloc.is_tracing() else 0
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter()
+        memory = tracemalloc.get_traced_memory()[0] - self.memory if tracemalloc.is_tracing() else 0
+        self.profiler.record(self.name, self.label, self.start, end, memory)
+        return False
+
+class _ThreadProfile:
+    def __init__(self, profiler):
+        self.profiler = profiler
+        self.profile = cProfile.Profile()
+        self.active = False
+
+    def __enter__(self):
+        try:
+            self.profile.enable()
+            self.active = True
+        except ValueError as e:
+            self.profiler.capture_failed(e)
+        return self
+
+    def __exit__(self, *exc):
+        if self.active:
+            self.profile.disable()
+            self.profiler.add_profile(self.profile)
+        return False
+
+class Profiler:
+    def __init__(self):
+        self.enabled = False
+        self.capture = False
+        self.run_name = None
+        self.records = []
+        self.profiles = []
+        self.capture_errors = []
+        self.version = 0
+        self._process_profile = None
+        self._owns_tracemalloc = False
+        self._lock = threading.Lock()
+
+    def set_enabled(self, enabled, capture=False):
+        self.enabled = enabled
+        self.capture = enabled and capture
+        self._restart_process_profile()
+        if enabled and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._owns_tracemalloc = True
+        elif not enabled and self._owns_tracemalloc:
+            tracemalloc.stop()
+            self._owns_tracemalloc = False
+
+    def begin(self, name):
+        if not self.enabled:
+            return
+        with self._lock:
+            self.run_name = name
+            self.records = []
+            self.profiles = []
+            self.capture_errors = []
+            self.version += 1
+        self._restart_process_profile()
+
+    def _restart_process_profile(self):
+        if self._process_profile is not None:
+            self._process_profile.disable()
+            self._process_profile = None
+        if not self.capture or not PROCESS_WIDE_PROFILE:
+            return
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError as e:
+            self.capture_failed(e)
+            return
+        self._process_profile = profile
+        self.add_profile(profile)
+
+    def stage(self, name, label=None):
+        if not self.enabled:
+            return _NULL
+        return _Stage(self, name, label)
+
+    def profile(self):
+        if not self.capture or PROCESS_WIDE_PROFILE:
+            return _NULL
+        return _ThreadProfile(self)
+
+    def record(self, name, label, start, end, memory):
+        with self._lock:
+            self.records.append((name, label, start, end, memory))
+            self.version += 1
+
+    def capture_failed(self, error):
+        with self._lock:
+            self.capture_errors.append(str(error))
+            self.version += 1
+
+    def add_profile(self, profile):
+        with self._lock:
+            self.profiles.append(profile)
+            self.version += 1
+
+    def breakdown(self):
+        with self._lock:
+            records = list(self.records)
+        stages = {}
+        for name, label, start, end, memory in records:
+            entry = stages.setdefault((name, label), [0, 0.0, 0])
+            entry[0] += 1
+            entry[1] += end - start
+            entry[2] += memory
+        wall = max(end for _, _, _, end, _ in records) - min(start for _, _, start, _, _ in records) if records else 0.0
+        return wall, [(name, label, count, seconds, memory) for (name, label), (count, seconds, memory) in stages.items()]
+
+    def report(self):
+        wall, stages = self.breakdown()
+        lines = [f"{self.run_name or 'no run yet'}: {wall * 1000:.1f} ms"]
+        for name, label, count, seconds, memory in stages:
+            stage = f"{name} [{label}]" if label else name
+            calls = f" x{count}" if count > 1 else ""
+            lines.append(f"  {stage:<32} {seconds * 1000:>9.1f} ms {memory / (1 << 20):>8.1f} MB{calls}")
+        if stages:
+            lines.append("  memory deltas are process-wide and include allocations from other threads")
+        with self._lock:
+            errors = list(dict.fromkeys(self.capture_errors))
+        lines += [f"  cProfile could not start: {error}" for error in errors]
+        return "\n".join(lines)
+
+    def dump(self, path):
+        with self._lock:
+            profiles = list(self.profiles)
+        if not profiles:
+            raise ValueError("No cProfile data was captured for the last run")
+        stats = pstats.Stats(profiles[0])
+        for profile in profiles[1:]:
+            stats.add(profile)
+        stats.dump_stats(path)
+        return path
+
+profiler = Profiler()
\ No newline at end of file
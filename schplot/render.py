@@ -0,0 +1,132 @@
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from .dataset import open_dataset
+from .logic import prepare_series
+from .plot_settings import PlotSettings
+from .plotting import ArtistRegistry, decorate_axes, series_warnings
+
+def spec_error(spec):
+    if not isinstance(spec, dict):
+        return "spec must be a mapping"
+    plots = spec.get("plots", [])
+    if not isinstance(plots, list) or not all(isinstance(plot, dict) for plot in plots):
+        return "'plots' must be a list of mappings"
+    if not isinstance(spec.get("file", ""), str) or not all(isinstance(plot.get("dataset_id", ""), str) for plot in plots):
+        return "'file' and 'dataset_id' must be paths"
+    if "file" not in spec and not all(plot.get("dataset_id") for plot in plots):
+        return "missing 'file'"
+    return None
+
+def load_specs(path):
+    with open(path, encoding="utf-8") as handle:
+        if path.endswith((".yaml", ".yml")):
+            try:
+                import yaml
+            except ImportError:
+                raise ValueError(f"PyYAML is required to read {path}")
+            specs = yaml.safe_load(handle)
+        else:
+            specs = json.load(handle)
+    if isinstance(specs, dict):
+        specs = [specs]
+    if not isinstance(specs, list):
+        raise ValueError(f"{path}: expected a spec or a list of specs")
+    base_dir = os.path.dirname(os.path.abspath(path))
+    stem = os.path.splitext(os.path.basename(path))[0]
+    valid = []
+    errors = []
+    for index, spec in enumerate(specs):
+        error = spec_error(spec)
+        if error is not None:
+            errors.append(f"{path}: spec {index + 1}: {error}")
+            continue
+        spec = dict(spec)
+        if "file" in spec:
+            spec["file"] = os.path.join(base_dir, spec["file"])
+        spec["plots"] = [dict(plot, dataset_id=os.path.join(base_dir, plot["dataset_id"])) if plot.get("dataset_id") else plot for plot in spec.get("plots", [])]
+        default_output = f"{stem}.png" if len(specs) == 1 else f"{stem}_{index + 1}.png"
+        spec["output"] = os.path.join(base_dir, spec.get("output", default_output))
+        valid.append(spec)
+    return valid, errors
+
+def render_spec(spec):
+    figure = Figure(figsize=(spec.get("width", 10), spec.get("height", 6)), dpi=spec.get("dpi", 100))
+    FigureCanvasAgg(figure)
+    ax = figure.add_subplot()
+    registry = ArtistRegistry(ax, interactive=False)
+    plots = [PlotSettings.from_dict(plot) for plot in spec.get("plots", [])]
+    datasets = {}
+    for plot in plots:
+        plot.dataset_id = plot.dataset_id or spec.get("file")
+        if plot.dataset_id not in datasets:
+            datasets[plot.dataset_id] = open_dataset(plot.dataset_id)
+    for dataset_id, dataset in datasets.items():
+        dataset.load([var for plot in plots if plot.dataset_id == dataset_id for var in (plot.x_var, plot.y_var)])
+    warnings = []
+    for plot in plots:
+        dataset = datasets[plot.dataset_id]
+        key = (dataset.version, plot.x_var, plot.y_var, plot.regression)
+        result = prepare_series(dataset, plot.x_var, plot.y_var, plot.regression, key=key)
+        warnings += [message for _, message in series_warnings(plot, result)]
+        entry = registry.entry(plot)
+        if entry.load_result(plot, result):
+            entry.show(plot)
+    decorate_axes(ax, registry, spec.get("title", ""), spec.get("x_label", ""), spec.get("y_label", ""), spec.get("grid", False))
+    registry.autoscale()
+    os.makedirs(os.path.dirname(spec["output"]) or ".", exist_ok=True)
+    figure.savefig(spec["output"])
+    return spec["output"], warnings
+
+def render_all(specs, jobs=None):
+    if jobs == 1 or len(specs) == 1:
+        for spec in specs:
+            try:
+                yield spec, render_spec(spec)[1], None
+            except Exception as e:
+                yield spec, [], e
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = {pool.submit(render_spec, spec): spec for spec in specs}
+        for future in as_completed(futures):
+            try:
+                yield futures[future], future.result()[1], None
+            except Exception as e:
+                yield futures[future], [], e
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="schplot render", description="Render plot specs to image files without starting the GUI.")
+    parser.add_argument("specs", nargs="+", help="JSON or YAML spec files")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="number of worker processes (default: CPU count)")
+    parser.add_argument("-f", "--format", default=None, help="override the output format, e.g. png or svg")
+    args = parser.parse_args(argv)
+    specs = []
+    failed = 0
+    for path in args.specs:
+        try:
+            valid, errors = load_specs(path)
+        except (OSError, ValueError) as e:
+            valid, errors = [], [str(e)]
+        specs += valid
+        for message in errors:
+            print(f"error: {message}", file=sys.stderr)
+            failed += 1
+    if args.format:
+        for spec in specs:
+            spec["output"] = f"{os.path.splitext(spec['output'])[0]}.{args.format}"
+    for spec, warnings, error in render_all(specs, args.jobs):
+        for message in warnings:
+            print(f"{spec['output']}: warning: {message}", file=sys.stderr)
+        if error is not None:
+            print(f"{spec['output']}: error: {error}", file=sys.stderr)
+            failed += 1
+        else:
+            print(spec["output"])
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,102 @@
+import io
+import json
+import os
+import zipfile
+import numpy as np
+from .dataset import Dataset
+from .logic import ARRAY_KEYS, regression_cache
+from .plot_settings import PlotSettings
+
+SESSION_FILE = "session.json"
+SESSION_FORMAT = 2
+
+def _stats_to_json(stats):
+    if not stats:
+        return None
+    return {key: value for key, value in stats.items() if key not in ARRAY_KEYS and not isinstance(value, np.ndarray)}
+
+def _stats_from_json(data):
+    stats = dict(data, coefficients=tuple(data["coefficients"]))
+    for key in ("x_range", "summary"):
+        if key in stats:
+            stats[key] = tuple(stats[key])
+    return stats
+
+def _upgrade_format_1(session):
+    source = session.pop("source")
+    session["datasets"] = [dict(source, id=source["path"], arrays=session.pop("arrays"))]
+    session["plots"] = [dict(plot, dataset_id=source["path"]) for plot in session["plots"]]
+    session["format"] = SESSION_FORMAT
+    return session
+
+def save_session(path, datasets, plots, view, stats=None, progress=None):
+    used = {}
+    for plot in plots:
+        dataset = datasets.get(plot.dataset_id)
+        if dataset is not None:
+            names = used.setdefault(plot.dataset_id, {})
+            names.update((var, None) for var in (plot.x_var, plot.y_var) if var in dataset)
+    stats = stats or {}
+    sources = []
+    for index, (dataset_id, names) in enumerate(used.items()):
+        dataset = datasets[dataset_id]
+        arrays = {name: f"columns/{index}/{column}.npy" for column, name in enumerate(names)}
+        sources.append({"id": dataset_id, "path": dataset.path, "version": list(dataset.version), "columns": dataset.columns, "arrays": arrays})
+    session = {
+        "format": SESSION_FORMAT,
+        "datasets": sources,
+        "view": view,
+        "plots": [plot.to_dict() for plot in plots],
+        "regressions": [_stats_to_json(stats.get(plot)) if (stats.get(plot) or {}).get("regression_type") == plot.regression else None for plot in plots]
+    }
+    total = sum(len(source["arrays"]) for source in sources)
+    written = 0
+    tmp = path + ".tmp"
+    with zipfile.ZipFile(tmp, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as archive:
+        for dataset_id, source in zip(used, sources):
+            dataset = datasets[dataset_id]
+            for name, member in source["arrays"].items():
+                with archive.open(member, "w", force_zip64=True) as handle:
+                    np.lib.format.write_array(handle, np.ascontiguousarray(dataset.column(name)), allow_pickle=False)
+                written += 1
+                if progress is not None:
+                    progress(written / total)
+        archive.writestr(SESSION_FILE, json.dumps(session, default=float, indent=1))
+    os.replace(tmp, path)
+    return path
+
+def load_session(path, cache=None, progress=None):
+    cache = regression_cache if cache is None else cache
+    with open(path, "rb") as handle:
+        data = handle.read()
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        session = json.loads(archive.read(SESSION_FILE).decode("utf-8"))
+        if session.get("format") == 1:
+            session = _upgrade_format_1(session)
+        if session.get("format") != SESSION_FORMAT:
+            raise ValueError(f"Unsupported session format: {session.get('format')}")
+        total = sum(len(source["arrays"]) for source in session["datasets"])
+        read = 0
+        datasets = {}
+        for source in session["datasets"]:
+            arrays = {}
+            for name, member in source["arrays"].items():
+                with archive.open(member) as handle:
+                    arrays[name] = np.lib.format.read_array(handle, allow_pickle=False)
+                read += 1
+                if progress is not None:
+                    progress(read / total)
+            datasets[source["id"]] = Dataset.from_arrays(source["path"], arrays, list(arrays), source["version"])
+    plots = [PlotSettings.from_dict(plot) for plot in session["plots"]]
+    sources = {source["id"]: source for source in session["datasets"]}
+    for plot in plots:
+        source = sources.get(plot.dataset_id)
+        for var in (plot.x_var, plot.y_var):
+            if source is not None and var in source["columns"] and var not in source["arrays"]:
+                raise ValueError(f"Session does not contain column '{var}' of {os.path.basename(source['path'])}")
+    for plot, saved in zip(plots, session.get("regressions", [])):
+        dataset = datasets.get(plot.dataset_id)
+        if saved is None or dataset is None or not dataset.loaded(plot.x_var) or not dataset.loaded(plot.y_var):
+            continue
+        cache.put((dataset.version, plot.x_var, plot.y_var, plot.regression), _stats_from_json(saved))
+    return datasets, plots, session.get("view", {})
\ No newline at end of file
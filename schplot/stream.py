@@ -0,0 +1,138 @@
+import io
+import os
+import numpy as np
+from .dataset import CSV_OPTIONS, to_array
+from .logic import RunningRegression
+
+TAIL_BLOCK_BYTES = 1 << 26
+POLL_BLOCK_BYTES = 1 << 22
+RESYNC_WINDOWS = 8
+
+class RingBuffer:
+    def __init__(self, capacity, dtype=np.float64):
+        self.capacity = capacity
+        self._data = np.empty(2 * capacity, dtype=dtype)
+        self._start = 0
+        self._end = 0
+
+    def __len__(self):
+        return self._end - self._start
+
+    def view(self):
+        return self._data[self._start:self._end]
+
+    def clear(self):
+        self._start = self._end = 0
+
+    def extend(self, values):
+        overflow = max(len(self) + len(values) - self.capacity, 0)
+        dropped = min(overflow, len(self))
+        evicted = self._data[self._start:self._start + dropped].copy()
+        if len(values) > self.capacity:
+            evicted = np.concatenate((evicted, values[:-self.capacity]))
+            values = values[-self.capacity:]
+        self._start += dropped
+        if self._end + len(values) > len(self._data):
+            size = len(self)
+            self._data[:size] = self._data[self._start:self._end]
+            self._start, self._end = 0, size
+        self._data[self._end:self._end + len(values)] = values
+        self._end += len(values)
+        return evicted
+
+class TailReader:
+    def __init__(self, path, names, columns, dtype=np.float64):
+        self.path = path
+        self.names = list(names)
+        self.columns = list(columns)
+        self.dtype = dtype
+        self.offset = None
+        self.partial = b''
+
+    def _header_length(self):
+        with open(self.path, 'rb') as handle:
+            return len(handle.readline())
+
+    def poll(self, max_bytes=TAIL_BLOCK_BYTES):
+        size = os.path.getsize(self.path)
+        reset = self.offset is None or size < self.offset
+        if reset:
+            self.offset = self._header_length()
+            self.partial = b''
+        if size <= self.offset:
+            return None, reset, True
+        with open(self.path, 'rb') as handle:
+            handle.seek(self.offset)
+            block = handle.read(min(size - self.offset, max_bytes))
+        self.offset += len(block)
+        data = self.partial + block
+        end = data.rfind(b'\n')
+        if end < 0:
+            self.partial = data
+            return None, reset, self.offset >= size
+        data, self.partial = data[:end + 1], data[end + 1:]
+        import pandas as pd
+        frame = pd.read_csv(io.BytesIO(data), header=None, names=self.names, usecols=self.columns, **CSV_OPTIONS)
+        arrays = {col: to_array(frame[col], self.dtype) for col in self.columns}
+        return arrays, reset, self.offset >= size
+
+class LiveSession:
+    def __init__(self, dataset, plots, window):
+        columns = list(dict.fromkeys(var for plot in plots for var in (plot.x_var, plot.y_var) if var in dataset))
+        self.reader = TailReader(dataset.path, dataset.columns, columns, dataset.dtype)
+        self.buffers = {col: RingBuffer(window, dataset.dtype) for col in columns}
+        self.plots = [plot for plot in plots if plot.x_var in self.buffers and plot.y_var in self.buffers]
+        self.regressions = {plot: RunningRegression(plot.regression) for plot in self.plots if plot.regression != "None"}
+        self.window = window
+
+    def poll(self, max_bytes=TAIL_BLOCK_BYTES):
+        arrays, reset, caught_up = self.reader.poll(max_bytes)
+        if reset:
+            for buffer in self.buffers.values():
+                buffer.clear()
+            for regression in self.regressions.values():
+                regression.clear()
+        if not arrays:
+            return reset, caught_up
+        evicted = {col: buffer.extend(arrays[col]) for col, buffer in self.buffers.items()}
+        for plot, regression in self.regressions.items():
+            regression.add(arrays[plot.x_var], arrays[plot.y_var])
+            regression.remove(evicted[plot.x_var], evicted[plot.y_var])
+            if regression.removed > RESYNC_WINDOWS * self.window:
+                regression.rebuild(*self.series(plot))
+        return True, caught_up
+
+    def seed(self, dataset):
+        if dataset.end is None or dataset.end > os.path.getsize(self.reader.path):
+            return
+        rows = -1 if dataset.partial_values is not None else None
+        for col, buffer in self.buffers.items():
+            buffer.extend(dataset.column(col)[:rows][-self.window:])
+        for plot, regression in self.regressions.items():
+            regression.rebuild(*self.series(plot))
+        self.reader.offset = dataset.end
+
+    def catch_up(self, dataset=None, progress=None):
+        if dataset is not None:
+            self.seed(dataset)
+        while True:
+            _, caught_up = self.poll()
+            if caught_up:
+                return self
+            if progress is not None:
+                progress(min(self.reader.offset / max(os.path.getsize(self.reader.path), 1), 1.0))
+
+    def series(self, plot):
+        return self.buffers[plot.x_var].view(), self.buffers[plot.y_var].view()
+
+    def stats(self, plot, full=False):
+        regression = self.regressions.get(plot)
+        if regression is None:
+            return None
+        x, y = self.series(plot)
+        if full or plot.regression == "Exponential":
+            return regression.stats(x, y)
+        stats = regression.stats()
+        if stats is not None:
+            stats["x"], stats["y"] = x, y
+        return stats
\ No newline at end of file
@@ -1,12 +1,23 @@
-import pandas as pd
+import os
+from functools import partial
 import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
-from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QFileDialog, QComboBox, QCheckBox, QLabel, QListWidget, QGroupBox, QLineEdit, QScrollArea, QMessageBox, QDialog, QTableWidget, QTableWidgetItem, QHeaderView)
-from PyQt5.QtCore import Qt
+from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QFileDialog, QComboBox, QCheckBox, QLabel, QListWidget, QListWidgetItem, QGroupBox, QLineEdit, QScrollArea, QMessageBox, QDialog, QPlainTextEdit, QProgressBar, QSpinBox, QTableWidget, QTableWidgetItem, QHeaderView)
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QFontDatabase
 from .plot_settings import PlotSettings
-from .logic import calculate_regression_stats
+from .dataset import open_dataset
+from .logic import prepare_series, prepare_series_batch
+from .workers import JobRunner
+from .frames import FrameScheduler
+from .profiling import profiler
+from .stream import LiveSession, POLL_BLOCK_BYTES
+from .outofcore import stream_series
+from .session import save_session, load_session
+from .export import export_script
+from .plotting import ArtistRegistry, decorate_axes, legend_location, series_warnings
 
 class RegressionDetailsWindow(QDialog):
     def __init__(self, parent=None):
@@ -27,11 +38,12 @@ class RegressionDetailsWindow(QDialog):
         self.table.setRowCount(0)
         self.setWindowTitle(f"Regression Details: {plot.label} - {regression_type}")
         self.add_table_row("Regression Type", regression_type)
-        self.add_table_row("Number of Points", str(len(x)))
-        self.add_table_row("X Mean", f"{np.mean(x):.6f}")
-        self.add_table_row("Y Mean", f"{np.mean(y):.6f}")
-        self.add_table_row("X Standard Deviation", f"{np.std(x):.6f}")
-        self.add_table_row("Y Standard Deviation", f"{np.std(y):.6f}")
+        n, x_mean, y_mean, x_std, y_std = stats.get("summary") or (len(x), np.mean(x), np.mean(y), np.std(x), np.std(y))
+        self.add_table_row("Number of Points", str(n))
+        self.add_table_row("X Mean", f"{x_mean:.6f}")
+        self.add_table_row("Y Mean", f"{y_mean:.6f}")
+        self.add_table_row("X Standard Deviation", f"{x_std:.6f}")
+        self.add_table_row("Y Standard Deviation", f"{y_std:.6f}")
         if regression_type == "Linear":
             m, b = stats["coefficients"]
             self.add_table_row("Formula", f"y = {m:.6f}x + {b:.6f}")
@@ -64,17 +76,36 @@ class DataPlottingGUI(QMainWindow):
         self.setWindowTitle("Schplot")
         self.setGeometry(100, 100, 1400, 800)
         self.plots = []
+        self.datasets = {}
         self.data = None
-        self.filename = ""
         self.regression_stats = {}
+        self.pending_series = {}
+        self.series_total = 0
+        self.files_total = 0
+        self.files_loaded = 0
+        self.load_progress = {}
+        self.pending_limits = None
+        self.jobs = JobRunner(self)
+        self.live = None
+        self.follow_timer = QTimer(self)
+        self.follow_timer.setInterval(200)
+        self.follow_timer.timeout.connect(self.poll_live)
+        self.profile_version = None
+        self.profile_timer = QTimer(self)
+        self.profile_timer.setInterval(500)
+        self.profile_timer.timeout.connect(self.refresh_profile)
         main_widget = QWidget(self)
         self.setCentralWidget(main_widget)
         main_layout = QHBoxLayout(main_widget)
         plot_widget = QWidget()
         plot_layout = QVBoxLayout(plot_widget)
-        self.figure, self.ax = plt.subplots()
+        self.figure = Figure()
+        self.ax = self.figure.add_subplot()
         self.canvas = FigureCanvas(self.figure)
         self.toolbar = NavigationToolbar(self.canvas, self)
+        self.artists = ArtistRegistry(self.ax)
+        self.frames = FrameScheduler(self.canvas, self.artists, parent=self)
+        self.canvas.mpl_connect('resize_event', self.artists.refresh)
         plot_layout.addWidget(self.toolbar)
         plot_layout.addWidget(self.canvas)
         main_layout.addWidget(plot_widget, stretch=7)
@@ -87,8 +118,12 @@ class DataPlottingGUI(QMainWindow):
         self.file_btn = QPushButton("Choose Files")
         self.file_btn.clicked.connect(self.select_file)
         control_layout.addWidget(self.file_btn)
+        self.out_of_core_check = QCheckBox("Stream Large Files (Out-of-Core)")
+        self.out_of_core_check.toggled.connect(self.reset_series)
+        control_layout.addWidget(self.out_of_core_check)
         self.plot_list = QListWidget()
         self.plot_list.itemClicked.connect(self.update_plot_settings)
+        self.plot_list.itemChanged.connect(self.toggle_plot_visibility)
         control_layout.addWidget(QLabel("Plots:"))
         control_layout.addWidget(self.plot_list)
         btn_layout = QHBoxLayout()
@@ -106,6 +141,10 @@ class DataPlottingGUI(QMainWindow):
         self.plot_name_edit = QLineEdit()
         settings_layout.addWidget(QLabel("Plot Name:"))
         settings_layout.addWidget(self.plot_name_edit)
+        self.dataset_combo = QComboBox()
+        self.dataset_combo.currentIndexChanged.connect(self.select_dataset)
+        settings_layout.addWidget(QLabel("Data File:"))
+        settings_layout.addWidget(self.dataset_combo)
         self.x_combo = QComboBox()
         self.y_combo = QComboBox()
         settings_layout.addWidget(QLabel("X Variable:"))
@@ -147,12 +186,60 @@ class DataPlottingGUI(QMainWindow):
         settings_layout.addWidget(self.marker_check)
         self.grid_check = QCheckBox("Grid")
         control_layout.addWidget(self.grid_check)
+        self.follow_check = QCheckBox("Follow File")
+        self.follow_check.toggled.connect(self.set_following)
+        control_layout.addWidget(self.follow_check)
+        self.window_spin = QSpinBox()
+        self.window_spin.setRange(1000, 100000000)
+        self.window_spin.setSingleStep(1000)
+        self.window_spin.setValue(100000)
+        control_layout.addWidget(QLabel("Follow Window (rows):"))
+        control_layout.addWidget(self.window_spin)
         self.update_btn = QPushButton("Update Plot")
         self.update_btn.clicked.connect(self.update_plot)
         control_layout.addWidget(self.update_btn)
+        self.progress_widget = QWidget()
+        progress_layout = QHBoxLayout(self.progress_widget)
+        progress_layout.setContentsMargins(0, 0, 0, 0)
+        self.progress_label = QLabel()
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setRange(0, 100)
+        self.cancel_btn = QPushButton("Cancel")
+        self.cancel_btn.clicked.connect(self.cancel_jobs)
+        progress_layout.addWidget(self.progress_label)
+        progress_layout.addWidget(self.progress_bar)
+        progress_layout.addWidget(self.cancel_btn)
+        control_layout.addWidget(self.progress_widget)
+        self.progress_widget.hide()
         self.save_code_btn = QPushButton("Save")
         self.save_code_btn.clicked.connect(self.save_simple_plot_code)
         control_layout.addWidget(self.save_code_btn)
+        session_layout = QHBoxLayout()
+        self.save_session_btn = QPushButton("Save Session")
+        self.save_session_btn.clicked.connect(self.save_session)
+        self.open_session_btn = QPushButton("Open Session")
+        self.open_session_btn.clicked.connect(self.open_session)
+        session_layout.addWidget(self.save_session_btn)
+        session_layout.addWidget(self.open_session_btn)
+        control_layout.addLayout(session_layout)
+        self.profile_check = QCheckBox("Profiling")
+        self.profile_check.toggled.connect(self.set_profiling)
+        control_layout.addWidget(self.profile_check)
+        self.profile_widget = QWidget()
+        profile_layout = QVBoxLayout(self.profile_widget)
+        profile_layout.setContentsMargins(0, 0, 0, 0)
+        self.capture_check = QCheckBox("Capture cProfile")
+        self.capture_check.toggled.connect(self.set_profiling)
+        profile_layout.addWidget(self.capture_check)
+        self.profile_text = QPlainTextEdit()
+        self.profile_text.setReadOnly(True)
+        self.profile_text.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+        profile_layout.addWidget(self.profile_text)
+        self.save_profile_btn = QPushButton("Save Profile")
+        self.save_profile_btn.clicked.connect(self.save_profile)
+        profile_layout.addWidget(self.save_profile_btn)
+        control_layout.addWidget(self.profile_widget)
+        self.profile_widget.hide()
         self.regression_details_window = RegressionDetailsWindow(self)
 
     def show_regression_details(self):
@@ -164,11 +251,13 @@ class DataPlottingGUI(QMainWindow):
         if plot.regression == "None":
             QMessageBox.warning(self, "Warning", "No regression selected for this plot")
             return
-        plot_key = f"{plot.label}_{plot.regression}"
-        if plot_key not in self.regression_stats:
+        if self.live is not None and plot in self.live.regressions:
+            stats = self.live.stats(plot, full=True)
+        else:
+            stats = self.regression_stats.get(plot)
+        if stats is None or stats["regression_type"] != plot.regression:
             QMessageBox.warning(self, "Warning", "Please update the plot to calculate regression stats first")
             return
-        stats = self.regression_stats[plot_key]
         x = stats["x"]
         y = stats["y"]
         self.regression_details_window.display_regression_details(plot, x, y, plot.regression, stats)
@@ -189,35 +278,106 @@ class DataPlottingGUI(QMainWindow):
         if self.data is None:
             return
         new_plot = PlotSettings()
+        new_plot.dataset_id = self.dataset_combo.currentData()
         self.plots.append(new_plot)
-        plot_name = f"Plot {len(self.plots)}"
-        new_plot.label = plot_name
-        self.plot_list.addItem(plot_name)
+        new_plot.label = f"Plot {len(self.plots)}"
+        self.add_plot_item(new_plot)
         self.plot_list.setCurrentRow(len(self.plots) - 1)
         self.update_plot_settings()
 
+    def add_plot_item(self, plot):
+        item = QListWidgetItem(plot.label)
+        item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+        item.setCheckState(Qt.Checked if plot.visible else Qt.Unchecked)
+        self.plot_list.addItem(item)
+
     def select_file(self):
-        file_name, _ = QFileDialog.getOpenFileName(self, "Select Data File", "", "CSV Files (*.csv);;Excel Files (*.xlsx)")
-        if file_name:
-            self.filename = file_name
-            if file_name.endswith('.csv'):
-                self.data = pd.read_csv(file_name, decimal=',', thousands='.', encoding='utf-8')
-                for col in self.data.columns:
-                    self.data[col] = pd.to_numeric(self.data[col], errors='coerce')
-            elif file_name.endswith('.xlsx'):
-                self.data = pd.read_excel(file_name)
-                unnamed_cols = [col for col in self.data.columns if 'Unnamed:' in str(col)]
-                self.data = self.data.drop(columns=unnamed_cols)
-            self.x_combo.clear()
-            self.y_combo.clear()
-            self.x_combo.addItems(self.data.columns)
-            self.y_combo.addItems(self.data.columns)
+        file_names, _ = QFileDialog.getOpenFileNames(self, "Select Data Files", "", "Data Files (*.csv *.xlsx);;CSV Files (*.csv);;Excel Files (*.xlsx)")
+        if file_names:
+            self.jobs.cancel_all()
+            profiler.begin(f"open {os.path.basename(file_names[0])}" if len(file_names) == 1 else f"open {len(file_names)} files")
+            self.show_progress("Loading files...")
+            self.files_total = len(file_names)
+            self.files_loaded = 0
+            for file_name in file_names:
+                self.jobs.start(open_dataset, file_name, finished=self.dataset_loaded, failed=partial(self.file_failed, file_name))
+
+    def file_done(self):
+        self.files_loaded += 1
+        self.set_progress(self.files_loaded / self.files_total)
+        if self.files_loaded == self.files_total:
+            self.hide_progress()
+
+    def dataset_loaded(self, dataset):
+        self.file_done()
+        self.follow_check.setChecked(False)
+        self.add_dataset(dataset)
+
+    def file_failed(self, file_name, error):
+        self.file_done()
+        QMessageBox.warning(self, "Error", f"Could not load {os.path.basename(file_name)}: {str(error)}")
+
+    def add_dataset(self, dataset):
+        dataset_id = dataset.path
+        if dataset_id in self.datasets:
+            for plot in self.plots:
+                if plot.dataset_id == dataset_id and plot in self.artists.entries:
+                    self.artists.entries[plot].data_key = None
+        else:
+            self.dataset_combo.addItem(os.path.basename(dataset.path), dataset_id)
+            self.dataset_combo.setItemData(self.dataset_combo.count() - 1, dataset.path, Qt.ToolTipRole)
+        self.datasets[dataset_id] = dataset
+        self.dataset_combo.setCurrentIndex(self.dataset_combo.findData(dataset_id))
+        self.select_dataset()
+
+    def clear_datasets(self):
+        self.datasets = {}
+        self.data = None
+        self.artists.clear()
+        self.regression_stats = {}
+        self.dataset_combo.clear()
+        self.x_combo.clear()
+        self.y_combo.clear()
+
+    def select_dataset(self, *args):
+        dataset = self.datasets.get(self.dataset_combo.currentData())
+        if dataset is None or dataset is self.data:
+            return
+        self.data = dataset
+        x_var = self.x_combo.currentText()
+        y_var = self.y_combo.currentText()
+        self.x_combo.clear()
+        self.y_combo.clear()
+        self.x_combo.addItems(dataset.columns)
+        self.y_combo.addItems(dataset.columns)
+        self.x_combo.setCurrentText(x_var)
+        self.y_combo.setCurrentText(y_var)
+
+    def show_progress(self, message):
+        self.progress_label.setText(message)
+        self.progress_bar.setValue(0)
+        self.progress_widget.show()
+
+    def set_progress(self, fraction):
+        self.progress_bar.setValue(int(fraction * 100))
+
+    def hide_progress(self):
+        self.progress_widget.hide()
+
+    def cancel_jobs(self):
+        self.jobs.cancel_all()
+        self.hide_progress()
+
+    def job_failed(self, error):
+        self.cancel_jobs()
+        QMessageBox.warning(self, "Error", f"An error occurred: {str(error)}")
 
     def update_plot_settings(self):
         current_row = self.plot_list.currentRow()
         if current_row >= 0:
             plot = self.plots[current_row]
             self.plot_name_edit.setText(plot.label)
+            self.dataset_combo.setCurrentIndex(self.dataset_combo.findData(plot.dataset_id))
             self.x_combo.setCurrentText(plot.x_var)
             self.y_combo.setCurrentText(plot.y_var)
             self.line_check.setChecked(plot.show_line)
@@ -243,6 +403,7 @@ class DataPlottingGUI(QMainWindow):
         if current_row >= 0:
             plot = self.plots[current_row]
             plot.label = self.plot_name_edit.text()
+            plot.dataset_id = self.dataset_combo.currentData()
             plot.x_var = self.x_combo.currentText()
             plot.y_var = self.y_combo.currentText()
             plot.show_line = self.line_check.isChecked()
@@ -251,120 +412,267 @@ class DataPlottingGUI(QMainWindow):
             plot.main_color = self.main_color_combo.currentText()
             plot.regression_color = self.regression_color_combo.currentText()
             self.plot_list.item(current_row).setText(plot.label)
-        self.ax.clear()
-        self.regression_stats = {}
+        self.stop_following()
+        self.jobs.cancel_all()
+        profiler.begin("update plot")
+        self.pending_series = {}
+        self.series_total = 0
+        groups = {}
+        for plot in self.plots:
+            dataset = self.datasets.get(plot.dataset_id)
+            if dataset is None:
+                continue
+            entry = self.artists.entry(plot)
+            data_key = (plot.dataset_id, plot.x_var, plot.y_var)
+            regression_key = (*data_key, plot.regression)
+            if entry.data_key == data_key and entry.regression_key == regression_key:
+                continue
+            xy = (entry.x, entry.y) if entry.data_key == data_key else None
+            groups.setdefault(plot.dataset_id, {}).setdefault(plot.x_var, []).append((plot, xy))
+            self.series_total += 1
+        if self.series_total == 0:
+            self.apply_plot()
+            return
+        self.load_progress = dict.fromkeys(groups, 0.0)
+        if self.out_of_core_check.isChecked():
+            self.show_progress("Streaming files...")
+            for dataset_id, dataset_groups in groups.items():
+                self.start_streaming(self.datasets[dataset_id], [plot for members in dataset_groups.values() for plot, _ in members])
+            return
+        self.show_progress("Loading columns...")
+        for dataset_id, dataset_groups in groups.items():
+            columns = [var for members in dataset_groups.values() for plot, xy in members if xy is None for var in (plot.x_var, plot.y_var)]
+            self.jobs.start(self.datasets[dataset_id].load, columns, finished=partial(self.compute_series, dataset_groups), failed=self.job_failed, progress=partial(self.set_load_progress, dataset_id))
+
+    def set_load_progress(self, dataset_id, fraction):
+        self.load_progress[dataset_id] = fraction
+        self.set_progress(sum(self.load_progress.values()) / len(self.load_progress))
+
+    def loading(self):
+        return any(fraction < 1.0 for fraction in self.load_progress.values())
+
+    def compute_series(self, groups, dataset):
+        self.set_load_progress(dataset.path, 1.0)
+        if not self.loading():
+            self.show_progress("Computing regressions...")
+            self.set_progress(len(self.pending_series) / self.series_total)
+        self.start_regressions(dataset, groups)
+
+    def start_streaming(self, dataset, plots):
+        self.jobs.start(stream_series, dataset.path, [(plot.x_var, plot.y_var, plot.regression) for plot in plots], finished=partial(self.batch_ready, plots), failed=self.job_failed, progress=partial(self.set_load_progress, dataset.path))
+
+    def start_regressions(self, dataset, groups):
+        for x_var, members in groups.items():
+            if len(members) == 1:
+                plot, xy = members[0]
+                key = (dataset.version, plot.x_var, plot.y_var, plot.regression)
+                self.jobs.start(prepare_series, dataset, plot.x_var, plot.y_var, plot.regression, key=key, xy=xy, finished=partial(self.series_ready, plot), failed=self.job_failed)
+            else:
+                plots = [plot for plot, _ in members]
+                keys = [(dataset.version, plot.x_var, plot.y_var, plot.regression) for plot in plots]
+                self.jobs.start(prepare_series_batch, dataset, x_var, [plot.y_var for plot in plots], [plot.regression for plot in plots], keys=keys, finished=partial(self.batch_ready, plots), failed=self.job_failed)
+
+    def save_session(self):
+        if self.data is None or not self.plots:
+            return
+        file_name, _ = QFileDialog.getSaveFileName(self, "Save Session", "", "Schplot Sessions (*.schplot)")
+        if file_name:
+            self.show_progress("Saving session...")
+            self.jobs.start(save_session, file_name, dict(self.datasets), list(self.plots), self.current_view(), dict(self.regression_stats), finished=lambda _: self.hide_progress(), failed=self.job_failed, progress=self.set_progress)
+
+    def current_view(self):
+        return {
+            "title": self.title_edit.text(),
+            "x_label": self.x_label_edit.text(),
+            "y_label": self.y_label_edit.text(),
+            "grid": self.grid_check.isChecked(),
+            "legend": legend_location(self.ax),
+            "autoscale": self.ax.get_autoscalex_on() and self.ax.get_autoscaley_on(),
+            "xlim": list(self.ax.get_xlim()),
+            "ylim": list(self.ax.get_ylim())
+        }
+
+    def open_session(self):
+        file_name, _ = QFileDialog.getOpenFileName(self, "Open Session", "", "Schplot Sessions (*.schplot)")
+        if file_name:
+            self.jobs.cancel_all()
+            self.show_progress("Opening session...")
+            self.jobs.start(load_session, file_name, finished=self.session_loaded, failed=self.job_failed, progress=self.set_progress)
+
+    def session_loaded(self, session):
+        datasets, plots, view = session
+        self.hide_progress()
+        self.follow_check.setChecked(False)
+        self.clear_datasets()
+        for dataset in datasets.values():
+            self.add_dataset(dataset)
+        self.plots = plots
+        self.plot_list.clear()
+        for plot in plots:
+            self.add_plot_item(plot)
+        self.title_edit.setText(view.get("title", ""))
+        self.x_label_edit.setText(view.get("x_label", ""))
+        self.y_label_edit.setText(view.get("y_label", ""))
+        self.grid_check.setChecked(view.get("grid", False))
+        self.pending_limits = None if view.get("autoscale", True) else (view["xlim"], view["ylim"])
+        if plots:
+            self.plot_list.setCurrentRow(0)
+            self.update_plot_settings()
+            self.update_plot()
+        else:
+            self.clear_plot_settings()
+
+    def reset_series(self):
+        for entry in self.artists.entries.values():
+            entry.data_key = None
+
+    def series_ready(self, plot, result):
+        self.pending_series[plot] = result
+        if not self.loading():
+            self.set_progress(len(self.pending_series) / self.series_total)
+        if len(self.pending_series) == self.series_total:
+            self.apply_plot()
+
+    def batch_ready(self, plots, results):
+        for plot, result in zip(plots, results):
+            self.series_ready(plot, result)
+
+    def apply_plot(self):
+        self.hide_progress()
+        rescale = self.artists.prune(self.plots)
         for plot in self.plots:
-            x = pd.to_numeric(self.data[plot.x_var], errors='coerce').values
-            y = pd.to_numeric(self.data[plot.y_var], errors='coerce').values
-            mask = np.isfinite(x) & np.isfinite(y)
-            x = x[mask]
-            y = y[mask]
-            if len(x) == 0 or len(y) == 0:
-                QMessageBox.warning(self, "Data Error", f"No valid data points for {plot.label}")
+            entry = self.artists.entry(plot)
+            if plot in self.pending_series:
+                result = self.pending_series[plot]
+                for title, message in series_warnings(plot, result):
+                    QMessageBox.warning(self, title, message)
+                with profiler.profile(), profiler.stage("artists", plot.label):
+                    if not entry.load_result(plot, result):
+                        continue
+                rescale = True
+            elif entry.data_key is None:
+                continue
+            with profiler.profile(), profiler.stage("artists", plot.label):
+                rescale |= entry.show(plot)
+        self.pending_series = {}
+        self.regression_stats = {plot: entry.stats for plot, entry in self.artists.entries.items() if entry.stats}
+        with profiler.profile(), profiler.stage("decorate"):
+            decorate_axes(self.ax, self.artists, self.title_edit.text(), self.x_label_edit.text(), self.y_label_edit.text(), self.grid_check.isChecked())
+            if rescale:
+                self.artists.autoscale()
+        if self.pending_limits is not None:
+            self.ax.set_xlim(self.pending_limits[0])
+            self.ax.set_ylim(self.pending_limits[1])
+            self.pending_limits = None
+        self.frames.request(full=True)
+        if rescale:
+            self.toolbar.update()
+        if self.follow_check.isChecked():
+            self.set_following(True)
+
+    def set_profiling(self, *args):
+        enabled = self.profile_check.isChecked()
+        profiler.set_enabled(enabled, self.capture_check.isChecked())
+        self.profile_widget.setVisible(enabled)
+        if enabled:
+            self.profile_timer.start()
+            self.refresh_profile()
+        else:
+            self.profile_timer.stop()
+            self.statusBar().clearMessage()
+
+    def refresh_profile(self):
+        if profiler.version == self.profile_version:
+            return
+        self.profile_version = profiler.version
+        report = profiler.report()
+        self.profile_text.setPlainText(report)
+        self.statusBar().showMessage(report.splitlines()[0])
+
+    def save_profile(self):
+        file_name, _ = QFileDialog.getSaveFileName(self, "Save Profile", "", "Profile Files (*.prof)")
+        if file_name:
+            try:
+                profiler.dump(file_name)
+            except (OSError, ValueError) as e:
+                QMessageBox.warning(self, "Error", f"Could not save the profile: {str(e)}")
+
+    def stop_following(self):
+        self.follow_timer.stop()
+        self.live = None
+
+    def set_following(self, checked):
+        self.stop_following()
+        if not checked:
+            for entry in self.artists.entries.values():
+                entry.data_key = None
+            return
+        plots = [plot for plot in self.plots if self.data is not None and plot.dataset_id == self.data.path and plot in self.artists.entries and self.artists.entries[plot].data_key is not None]
+        if self.data is None or not self.data.path.endswith('.csv') or not plots:
+            QMessageBox.warning(self, "Warning", "Plot data from a CSV file before following it")
+            self.follow_check.setChecked(False)
+            return
+        live = LiveSession(self.data, plots, self.window_spin.value())
+        self.show_progress("Reading file...")
+        self.jobs.start(live.catch_up, self.data, finished=self.live_ready, failed=self.live_failed, progress=self.set_progress)
+
+    def live_ready(self, live):
+        self.hide_progress()
+        if not self.follow_check.isChecked():
+            return
+        self.live = live
+        self.apply_live()
+        self.follow_timer.start()
+
+    def live_failed(self, error):
+        self.follow_check.setChecked(False)
+        self.job_failed(error)
+
+    def poll_live(self):
+        if self.live is None:
+            return
+        try:
+            changed, _ = self.live.poll(POLL_BLOCK_BYTES)
+        except (OSError, ValueError) as e:
+            self.live_failed(e)
+            return
+        if changed:
+            self.apply_live()
+
+    def apply_live(self):
+        relabel = False
+        for plot in self.live.plots:
+            entry = self.artists.entries.get(plot)
+            if entry is None:
                 continue
-            if plot.show_line and plot.show_markers:
-                self.ax.plot(x, y, color=plot.main_color, label=plot.label, marker='o')
-            elif plot.show_line:
-                self.ax.plot(x, y, color=plot.main_color, label=plot.label)
-            elif plot.show_markers:
-                self.ax.scatter(x, y, color=plot.main_color, label=plot.label)
-            if plot.regression != "None":
-                try:
-                    stats = calculate_regression_stats(x, y, plot.regression)
-                    if stats:
-                        if plot.regression == "Linear":
-                            y_pred = np.poly1d(stats["coefficients"])(x)
-                            formula = stats["formula"]
-                            r2 = stats["r2"]
-                            self.ax.plot(x, y_pred, color=plot.regression_color, linestyle='--', label=f"{plot.label} (Linear: {formula}, R-squared = {r2:.5f})")
-                            self.regression_stats[f"{plot.label}_Linear"] = stats
-                        elif plot.regression == "Exponential":
-                            mask = y > 0
-                            x_clean, y_clean = x[mask], y[mask]
-                            y_pred = np.exp(np.poly1d((stats["coefficients"][1], stats["coefficients"][0]))(x_clean))
-                            formula = stats["formula"]
-                            r2 = stats["r2"]
-                            self.ax.plot(x_clean, y_pred, color=plot.regression_color, linestyle='--', label=f"{plot.label} (Exp: {formula}, R-squared = {r2:.5f})")
-                            self.regression_stats[f"{plot.label}_Exponential"] = stats
-                        elif plot.regression == "Logarithmic":
-                            mask = x > 0
-                            x_clean, y_clean = x[mask], y[mask]
-                            y_pred = np.poly1d((stats["coefficients"][0], stats["coefficients"][1]))(np.log(x_clean))
-                            formula = stats["formula"]
-                            r2 = stats["r2"]
-                            self.ax.plot(x_clean, y_pred, color=plot.regression_color, linestyle='--', label=f"{plot.label} (Log: {formula}, R-squared = {r2:.5f})")
-                            self.regression_stats[f"{plot.label}_Logarithmic"] = stats
-                except np.linalg.LinAlgError:
-                    QMessageBox.warning(self, "Regression Error", f"Could not perform regression for {plot.label}. The data might be constant or have other issues.")
-                except Exception as e:
-                    QMessageBox.warning(self, "Error", f"An error occurred while processing {plot.label}: {str(e)}")
-        self.ax.grid(self.grid_check.isChecked())
-        self.ax.legend()
-        self.ax.set_xlabel(self.x_label_edit.text())
-        self.ax.set_ylabel(self.y_label_edit.text())
-        self.ax.set_title(self.title_edit.text())
-        self.canvas.draw()
-        self.toolbar.update()
+            entry.replace_data(*self.live.series(plot))
+            stats = self.live.stats(plot)
+            if stats is not None:
+                label = entry.regression_artist.get_label() if entry.regression_artist is not None else None
+                entry.update_regression(plot, stats)
+                relabel |= entry.regression_artist.get_label() != label
+                self.regression_stats[plot] = stats
+        if relabel:
+            self.artists.update_legend()
+        if self.ax.get_autoscalex_on() or self.ax.get_autoscaley_on():
+            self.artists.autoscale()
+        self.frames.request(full=relabel)
+
+    def toggle_plot_visibility(self, item):
+        row = self.plot_list.row(item)
+        if row < 0 or row >= len(self.plots):
+            return
+        plot = self.plots[row]
+        plot.visible = item.checkState() == Qt.Checked
+        if plot in self.artists.entries:
+            self.artists.entries[plot].set_visible(plot.visible)
+            self.artists.update_legend()
+            self.frames.request(full=True)
 
     def save_simple_plot_code(self):
         if not self.plots:
             return
-        code = []
-        code.append("# -*- coding: utf-8 -*-")
-        code.append("import pandas as pd")
-        code.append("import matplotlib.pyplot as plt")
-        code.append("import numpy as np")
-        code.append("from sklearn.metrics import r2_score\n")
-        if self.filename.endswith('.csv'):
-            code.append(f"data = pd.read_csv('{self.filename}')")
-        elif self.filename.endswith('.xlsx'):
-            code.append(f"data = pd.read_excel('{self.filename}')")
-        code.append("")
-        code.append("plt.figure(figsize=(10, 6))")
-        for plot in self.plots:
-            code.append(f"x = data['{plot.x_var}']")
-            code.append(f"y = data['{plot.y_var}']")
-            if plot.show_line and plot.show_markers:
-                code.append(f"plt.plot(x, y, color='{plot.main_color}', label='{plot.label}', marker='o')")
-            elif plot.show_line:
-                code.append(f"plt.plot(x, y, color='{plot.main_color}', label='{plot.label}')")
-            elif plot.show_markers:
-                code.append(f"plt.scatter(x, y, color='{plot.main_color}', label='{plot.label}')")
-            if plot.regression != "None":
-                if plot.regression == "Linear":
-                    code.append("z = np.polyfit(x, y, 1)")
-                    code.append("p = np.poly1d(z)")
-                    code.append("y_pred = p(x)")
-                    code.append("r2 = r2_score(y, y_pred)")
-                    code.append("formula = f'y = {z[0]:.7f}x + {z[1]:.7f}'")
-                    code.append(f"plt.plot(x, p(x), color='{plot.regression_color}', linestyle='--', label=f'{plot.label} (Linear: {{formula}}, R-squared = {{r2:.5f}}')")
-                elif plot.regression == "Exponential":
-                    code.append("# Remove non-positive values")
-                    code.append("mask = y > 0")
-                    code.append("x_clean, y_clean = x[mask], y[mask]")
-                    code.append("z = np.polyfit(x_clean, np.log(y_clean), 1)")
-                    code.append("p = np.poly1d(z)")
-                    code.append("y_pred = np.exp(p(x_clean))")
-                    code.append("r2 = r2_score(y_clean, y_pred)")
-                    code.append("formula = f'y = {np.exp(z[1]):.7f} * e^({z[0]:.7f}x)'")
-                    code.append(f"plt.plot(x_clean, np.exp(p(x_clean)), color='{plot.regression_color}', linestyle='--', label=f'{plot.label} (Exp: {{formula}}, R-squared = {{r2:.5f}}')")
-                elif plot.regression == "Logarithmic":
-                    code.append("# Remove non-positive values")
-                    code.append("mask = x > 0")
-                    code.append("x_clean, y_clean = x[mask], y[mask]")
-                    code.append("z = np.polyfit(np.log(x_clean), y_clean, 1)")
-                    code.append("p = np.poly1d(z)")
-                    code.append("y_pred = p(np.log(x_clean))")
-                    code.append("r2 = r2_score(y_clean, y_pred)")
-                    code.append("formula = f'y = {z[0]:.7f} * ln(x) + {z[1]:.7f}'")
-                    code.append(f"plt.plot(x_clean, p(np.log(x_clean)), color='{plot.regression_color}', linestyle='--', label=f'{plot.label} (Log: {{formula}}, R-squared = {{r2:.5f}}')")
-        code.append(f"plt.grid({self.grid_check.isChecked()})")
-        code.append("plt.legend()")
-        code.append(f"plt.xlabel('{self.x_label_edit.text()}')")
-        code.append(f"plt.ylabel('{self.y_label_edit.text()}')")
-        code.append(f"plt.title('{self.title_edit.text()}')")
-        code.append("plt.show()")
         file_name, _ = QFileDialog.getSaveFileName(self, "Save Simple Plot Code", "", "Python Files (*.py)")
         if file_name:
             with open(file_name, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(code)) 
\ No newline at end of file
+                f.write(export_script(self.datasets, self.plots, self.current_view(), self.regression_stats))
\ No newline at end of file
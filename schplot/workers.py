@@ -0,0 +1,68 @@
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+from .profiling import profiler
+
+class JobCancelled(Exception):
+    pass
+
+class JobSignals(QObject):
+    progress = pyqtSignal(float)
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(object)
+    done = pyqtSignal()
+
+class Job(QRunnable):
+    def __init__(self, func, *args, **kwargs):
+        super().__init__()
+        self.func = func
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = JobSignals()
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+    def report(self, fraction):
+        if self.cancelled:
+            raise JobCancelled()
+        self.signals.progress.emit(fraction)
+
+    def run(self):
+        try:
+            with profiler.profile():
+                result = self.func(*self.args, progress=self.report, **self.kwargs)
+        except JobCancelled:
+            pass
+        except Exception as e:
+            if not self.cancelled:
+                self.signals.failed.emit(e)
+        else:
+            if not self.cancelled:
+                self.signals.finished.emit(result)
+        finally:
+            self.signals.done.emit()
+
+class JobRunner(QObject):
+    def __init__(self, parent=None, pool=None):
+        super().__init__(parent)
+        self.pool = pool or QThreadPool.globalInstance()
+        self.jobs = set()
+
+    def start(self, func, *args, finished=None, failed=None, progress=None, **kwargs):
+        job = Job(func, *args, **kwargs)
+        self.jobs.add(job)
+        job.signals.finished.connect(lambda result: self._deliver(job, finished, result))
+        job.signals.failed.connect(lambda error: self._deliver(job, failed, error))
+        job.signals.done.connect(lambda: self.jobs.discard(job))
+        if progress is not None:
+            job.signals.progress.connect(progress)
+        self.pool.start(job)
+        return job
+
+    def _deliver(self, job, callback, value):
+        if callback is not None and not job.cancelled:
+            callback(value)
+
+    def cancel_all(self):
+        for job in self.jobs:
+            job.cancel()
\ No newline at end of file
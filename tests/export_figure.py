@@ -0,0 +1,36 @@
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from schplot.dataset import open_dataset
+from schplot.export import DPI, FIGSIZE
+from schplot.logic import prepare_series
+from schplot.plot_settings import PlotSettings
+from schplot.plotting import ArtistRegistry, decorate_axes, legend_location
+
+PLOTS = [
+    {"x_var": "x", "y_var": "linear", "label": "linear", "show_line": True, "show_markers": False, "regression": "Linear"},
+    {"x_var": "x", "y_var": "exponential", "label": "exponential", "main_color": "Green", "regression": "Exponential", "regression_color": "Black"},
+    {"x_var": "x", "y_var": "logarithmic", "label": "logarithmic", "main_color": "Cyan", "show_line": True, "regression": "Logarithmic", "regression_color": "Magenta"}
+]
+VIEW = {"title": "Export check", "x_label": "x", "y_label": "y", "grid": True}
+
+def app_figure(path, output=None):
+    figure = Figure(figsize=FIGSIZE, dpi=DPI)
+    FigureCanvasAgg(figure)
+    ax = figure.add_subplot()
+    registry = ArtistRegistry(ax, interactive=False)
+    dataset = open_dataset(path, cache=False)
+    plots = [PlotSettings.from_dict(dict(plot, dataset_id=path)) for plot in PLOTS]
+    stats = {}
+    for plot in plots:
+        result = prepare_series(dataset, plot.x_var, plot.y_var, plot.regression)
+        entry = registry.entry(plot)
+        if entry.load_result(plot, result):
+            entry.show(plot)
+        stats[plot] = result[2]
+    decorate_axes(ax, registry, VIEW["title"], VIEW["x_label"], VIEW["y_label"], VIEW["grid"])
+    registry.autoscale()
+    if output is None:
+        figure.canvas.draw()
+    else:
+        figure.savefig(output)
+    return {path: dataset}, plots, stats, dict(VIEW, autoscale=True, legend=legend_location(ax))
\ No newline at end of file
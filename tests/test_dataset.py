@@ -0,0 +1,73 @@
+import csv
+import numpy as np
+import pytest
+from schplot.dataset import Dataset, load_columns, read_header
+
+def write_csv(path, rows, offset=0.0):
+    with open(path, "w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle, quoting=csv.QUOTE_ALL)
+        writer.writerow(["t", "v", "w"])
+        for index in range(rows):
+            v = "n/a" if index % 7 == 6 else f"{index * 0.5 + offset:.1f}".replace(".", ",")
+            writer.writerow([str(index), v, f"{-index:.1f}".replace(".", ",")])
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("SCHPLOT_CACHE_DIR", str(tmp_path / "cache"))
+
+def test_chunked_load_matches_single_chunk(tmp_path):
+    path = str(tmp_path / "data.csv")
+    write_csv(path, 100)
+    whole = load_columns(path, ["t", "v"])
+    chunked = load_columns(path, ["t", "v"], chunk_rows=9)
+    assert list(chunked) == ["t", "v"]
+    for column in whole:
+        np.testing.assert_array_equal(chunked[column], whole[column])
+    assert np.isnan(whole["v"][6]) and whole["v"][5] == 2.5
+
+def test_dataset_loads_only_requested_columns(tmp_path):
+    path = str(tmp_path / "data.csv")
+    write_csv(path, 20)
+    dataset = Dataset(path)
+    assert dataset.columns == read_header(path) == ["t", "v", "w"]
+    dataset.load(["t", "missing"])
+    assert dataset.loaded("t") and not dataset.loaded("v") and not dataset.loaded("w")
+    np.testing.assert_array_equal(dataset.column("w"), -np.arange(20.0))
+    with pytest.raises(KeyError):
+        dataset.column("missing")
+
+def test_datasets_from_several_files_stay_separate(tmp_path):
+    paths = [str(tmp_path / f"run{index}.csv") for index in range(3)]
+    for index, path in enumerate(paths):
+        write_csv(path, 10 + index, offset=100.0 * index)
+    datasets = [Dataset(path).load(["t", "v"]) for path in paths]
+    assert [len(dataset.column("t")) for dataset in datasets] == [10, 11, 12]
+    assert [dataset.column("v")[0] for dataset in datasets] == [0.0, 100.0, 200.0]
+    assert len({dataset.version for dataset in datasets}) == 3
+
+def test_cached_columns_match_parsed_columns(tmp_path):
+    path = str(tmp_path / "data.csv")
+    write_csv(path, 50)
+    parsed = Dataset(path).load(["v"]).column("v")
+    cached = Dataset(path)
+    assert cached.cache.get("v", np.float64) is not None
+    np.testing.assert_array_equal(cached.column("v"), parsed)
+
+def test_load_reads_up_to_end(tmp_path):
+    path = str(tmp_path / "data.csv")
+    write_csv(path, 30)
+    with open(path, "rb") as handle:
+        data = handle.read()
+    end = [index for index, byte in enumerate(data) if byte == ord("\n")][10] + 1
+    assert len(load_columns(path, ["t"], end=end)["t"]) == 10
+
+def test_columns_are_cached_under_the_signature_at_load_time(tmp_path):
+    path = str(tmp_path / "data.csv")
+    write_csv(path, 20)
+    opened = Dataset(path)
+    with open(path, "a", encoding="utf-8") as handle:
+        handle.write('"20","10,0","-20,0"\n')
+    assert len(opened.load(["t"]).column("t")) == 21
+    reopened = Dataset(path)
+    assert reopened.version == opened.version
+    assert len(reopened.cache.get("t", np.float64)) == 21
\ No newline at end of file
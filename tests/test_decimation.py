@@ -0,0 +1,33 @@
+import numpy as np
+from schplot.decimation import data_range, decimate_line, decimate_scatter
+
+def test_decimate_line_bounds_points_and_keeps_extrema():
+    rng = np.random.default_rng(0)
+    x = np.arange(100000, dtype=np.float64)
+    y = rng.normal(0.0, 1.0, len(x))
+    y[12345] = 50.0
+    y[67890] = -50.0
+    n_buckets = 100
+    xd, yd = decimate_line(x, y, (x[0], x[-1]), n_buckets)
+    assert len(xd) <= 4 * n_buckets
+    assert np.all(np.diff(xd) > 0)
+    assert yd.max() == y.max() and yd.min() == y.min()
+    assert xd[0] == x[0] and xd[-1] == x[-1]
+
+def test_decimate_line_keeps_neighbours_of_visible_range():
+    x = np.arange(10, dtype=np.float64)
+    xd, _ = decimate_line(x, x, (3.5, 5.5), 100)
+    np.testing.assert_array_equal(xd, [3.0, 4.0, 5.0, 6.0])
+
+def test_decimate_scatter_one_point_per_pixel():
+    rng = np.random.default_rng(1)
+    x = rng.uniform(0.0, 1.0, 200000)
+    y = rng.uniform(0.0, 1.0, 200000)
+    xd, yd = decimate_scatter(x, y, (0.0, 1.0), (0.0, 1.0), 50, 40)
+    assert len(xd) <= 50 * 40
+    pixels = np.floor(xd * 50).astype(int) * 40 + np.floor(yd * 40).astype(int)
+    assert len(np.unique(pixels)) == len(pixels)
+
+def test_data_range_ignores_non_finite():
+    assert data_range(np.array([np.nan, 2.0, -np.inf, 5.0])) == (2.0, 5.0)
+    assert data_range(np.array([])) == (0.0, 1.0)
\ No newline at end of file
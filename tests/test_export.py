@@ -0,0 +1,60 @@
+import csv
+import runpy
+import subprocess
+import sys
+import numpy as np
+import pytest
+from export_figure import app_figure
+
+ROWS = 2000
+
+def write_data(path):
+    rng = np.random.default_rng(0)
+    x = np.arange(ROWS) / 100.0 + 1.0
+    columns = {
+        "x": x,
+        "linear": 0.75 * x + 3.0 + rng.normal(0.0, 1.0, ROWS),
+        "exponential": 2.5 * np.exp(0.1 * x) * rng.lognormal(0.0, 0.05, ROWS),
+        "logarithmic": 4.0 * np.log(x) + 1.5 + rng.normal(0.0, 0.2, ROWS)
+    }
+    with open(path, "w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle, quoting=csv.QUOTE_ALL)
+        writer.writerow(list(columns))
+        for index, row in enumerate(zip(*columns.values())):
+            values = [f"{value:.6f}".replace(".", ",") for value in row]
+            if index % 500 == 499:
+                values[1] = "n/a"
+            writer.writerow(values)
+
+@pytest.fixture
+def exported(tmp_path):
+    from schplot.export import export_script
+    path = str(tmp_path / "data.csv")
+    write_data(path)
+    expected = str(tmp_path / "app.png")
+    datasets, plots, stats, view = app_figure(path, expected)
+    script = str(tmp_path / "plot.py")
+    with open(script, "w", encoding="utf-8") as handle:
+        handle.write(export_script(datasets, plots, view, stats))
+    return script, expected, datasets, plots, stats
+
+@pytest.mark.parametrize("extra", [[], ["--precomputed"]], ids=["refit", "precomputed"])
+def test_script_redraws_app_figure(exported, tmp_path, extra):
+    from matplotlib.testing.compare import compare_images
+    script, expected = exported[:2]
+    actual = str(tmp_path / "script.png")
+    subprocess.run([sys.executable, script, "-o", actual, *extra], check=True)
+    result = compare_images(expected, actual, 0.01, in_decorator=True)
+    assert result is None, f"rms {result['rms']:.3f}, see {result['diff']}"
+
+def test_script_fits_match_app(exported):
+    script, _, datasets, plots, stats = exported
+    namespace = runpy.run_path(script)
+    for plot in plots:
+        dataset = datasets[plot.dataset_id]
+        x, y = dataset.column(plot.x_var), dataset.column(plot.y_var)
+        mask = np.isfinite(x) & np.isfinite(y)
+        coefficients, r2, _ = namespace["fit"](x[mask], y[mask], plot.regression)
+        formula = namespace["curve"](plot.regression, coefficients, (1.0, 2.0))[2]
+        assert formula == stats[plot]["formula"]
+        assert r2 == pytest.approx(stats[plot]["r2"])
\ No newline at end of file
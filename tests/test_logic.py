@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+from schplot.logic import RegressionCache, cached_regression_stats, calculate_regression_stats, calculate_regression_stats_batch, data_fingerprint, unpack_regression_batch
+
+REGRESSION_TYPES = ["Linear", "Exponential", "Logarithmic"]
+
+@pytest.mark.parametrize("regression_type", REGRESSION_TYPES)
+def test_constant_x_raises_in_batch_and_single_series(regression_type):
+    x = np.full(50, 3.0)
+    y = np.linspace(1.0, 2.0, 50)
+    with pytest.raises(np.linalg.LinAlgError):
+        calculate_regression_stats(x, y, regression_type)
+    batch = calculate_regression_stats_batch(x, y[:, None], [regression_type])
+    with pytest.raises(np.linalg.LinAlgError):
+        unpack_regression_batch(batch, 0, x, y)
+
+@pytest.mark.parametrize("regression_type", REGRESSION_TYPES)
+def test_batch_matches_single_series(regression_type):
+    rng = np.random.default_rng(0)
+    x = rng.uniform(1.0, 10.0, 500)
+    y = np.exp(0.2 * x) + rng.uniform(0.0, 0.5, 500)
+    expected = calculate_regression_stats(x, y, regression_type)
+    batch = calculate_regression_stats_batch(x, y[:, None], [regression_type])
+    actual = unpack_regression_batch(batch, 0, x, y)
+    np.testing.assert_allclose(actual["coefficients"], expected["coefficients"])
+    for metric in ("r2", "rmse", "mae"):
+        assert actual[metric] == pytest.approx(expected[metric])
+
+def test_regression_cache_evicts_least_recently_used():
+    cache = RegressionCache(max_entries=2)
+    cache.put("a", {"regression_type": "Linear"})
+    cache.put("b", {"regression_type": "Linear"})
+    cache.get("a")
+    cache.put("c", {"regression_type": "Linear"})
+    assert "a" in cache and "c" in cache and "b" not in cache
+
+def test_cached_stats_are_keyed_by_data_and_keep_no_arrays():
+    cache = RegressionCache()
+    x = np.arange(10, dtype=np.float64)
+    y = 2 * x + 1
+    first = cached_regression_stats(x, y, "Linear", cache=cache)
+    again = cached_regression_stats(x.copy(), y.copy(), "Linear", cache=cache)
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert again["formula"] == first["formula"]
+    np.testing.assert_allclose(again["residuals"], first["residuals"])
+    assert not any(isinstance(value, np.ndarray) for value in cache.get((data_fingerprint(x, y), "Linear")).values())
+    cached_regression_stats(x, y + 1, "Linear", cache=cache)
+    assert len(cache) == 2
\ No newline at end of file
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+from schplot.dataset import load_columns
+from schplot.logic import calculate_regression_stats
+from schplot.outofcore import BinPyramid, stream_series
+
+REGRESSION_TYPES = ["Linear", "Exponential", "Logarithmic"]
+
+@pytest.fixture
+def data(tmp_path):
+    rng = np.random.default_rng(0)
+    x = np.arange(1.0, 5001.0) / 100.0
+    y = np.exp(0.05 * x) * rng.lognormal(0.0, 0.05, len(x))
+    path = str(tmp_path / "data.csv")
+    with open(path, "w", encoding="utf-8") as handle:
+        handle.write('"x","y"\n')
+        for index, (u, v) in enumerate(zip(x, y)):
+            value = "n/a" if index % 97 == 96 else repr(float(v)).replace(".", ",")
+            handle.write(f'"{repr(float(u)).replace(".", ",")}","{value}"\n')
+    return path
+
+@pytest.mark.parametrize("regression_type", REGRESSION_TYPES)
+def test_stream_series_matches_in_memory_fit(data, regression_type):
+    arrays = load_columns(data, ["x", "y"])
+    mask = np.isfinite(arrays["x"]) & np.isfinite(arrays["y"])
+    expected = calculate_regression_stats(arrays["x"][mask], arrays["y"][mask], regression_type)
+    series, _, stats, error = stream_series(data, [("x", "y", regression_type)], chunk_rows=777)[0]
+    assert error is None
+    assert len(series) == np.count_nonzero(mask)
+    np.testing.assert_allclose(stats["coefficients"], expected["coefficients"])
+    for metric in ("r2", "rmse", "mae"):
+        assert stats[metric] == pytest.approx(expected[metric])
+
+def test_stream_series_preserves_extrema(data):
+    arrays = load_columns(data, ["x", "y"])
+    series = stream_series(data, [("x", "y", "None")], chunk_rows=500)[0][0]
+    (x_lo, x_hi), (y_lo, y_hi) = series.ranges()
+    assert (x_lo, x_hi) == (np.nanmin(arrays["x"]), np.nanmax(arrays["x"]))
+    assert (y_lo, y_hi) == (np.nanmin(arrays["y"]), np.nanmax(arrays["y"]))
+    x, y = series.decimate("line", (x_lo, x_hi), (y_lo, y_hi), 100, 100)
+    assert len(x) <= 4 * 100 + 4
+    assert y.max() == y_hi and y.min() == y_lo
+
+def test_pyramid_bins_stay_within_limit():
+    pyramid = BinPyramid(["v"], max_bins=64)
+    for start in range(0, 10000, 333):
+        pyramid.add({"v": np.arange(start, min(start + 333, 10000), dtype=np.float64)})
+    pyramid.finish()
+    base = pyramid.levels[0]["v"]
+    assert base.shape[1] <= 64
+    assert base[3].sum() == 10000 and base[2].sum() == np.arange(10000.0).sum()
\ No newline at end of file
@@ -0,0 +1,33 @@
+import json
+import pytest
+from schplot.render import load_specs, main
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("SCHPLOT_CACHE_DIR", str(tmp_path / "cache"))
+
+def write_specs(tmp_path, specs):
+    with open(tmp_path / "data.csv", "w", encoding="utf-8") as handle:
+        handle.write('"t","v"\n' + "".join(f'"{index}","{2 * index + 1},5"\n' for index in range(50)))
+    path = tmp_path / "specs.json"
+    path.write_text(json.dumps(specs), encoding="utf-8")
+    return str(path)
+
+def test_load_specs_reports_bad_specs_by_index(tmp_path):
+    plots = [{"x_var": "t", "y_var": "v", "regression": "Linear"}]
+    path = write_specs(tmp_path, [{"plots": plots}, {"file": "data.csv", "plots": plots}, 5])
+    specs, errors = load_specs(path)
+    assert [spec["file"] for spec in specs] == [str(tmp_path / "data.csv")]
+    assert errors == [f"{path}: spec 1: missing 'file'", f"{path}: spec 3: spec must be a mapping"]
+
+def test_main_renders_valid_specs_and_fails_on_bad_ones(tmp_path, capsys):
+    plots = [{"x_var": "t", "y_var": "v", "regression": "Linear"}]
+    path = write_specs(tmp_path, [
+        {"file": "data.csv", "output": "good.png", "plots": plots},
+        {"plots": plots},
+        {"file": "data.csv", "output": "svg/good.svg", "plots": plots}
+    ])
+    assert main([path, "-j", "1"]) == 1
+    assert (tmp_path / "good.png").stat().st_size > 0
+    assert (tmp_path / "svg" / "good.svg").stat().st_size > 0
+    assert "spec 2: missing 'file'" in capsys.readouterr().err
\ No newline at end of file
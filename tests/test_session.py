@@ -0,0 +1,90 @@
+import io
+import json
+import os
+import zipfile
+import numpy as np
+import pytest
+from schplot.dataset import Dataset
+from schplot.logic import RegressionCache
+from schplot.plot_settings import PlotSettings
+from schplot.session import SESSION_FILE, load_session, save_session
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("SCHPLOT_CACHE_DIR", str(tmp_path / "cache"))
+
+@pytest.fixture
+def saved(tmp_path):
+    path = str(tmp_path / "data.csv")
+    with open(path, "w", encoding="utf-8") as handle:
+        handle.write('"t","v","w"\n' + "".join(f'"{index}","{2 * index + 1},5","{index % 3}"\n' for index in range(40)))
+    dataset = Dataset(path)
+    plot = PlotSettings.from_dict({"x_var": "t", "y_var": "v", "regression": "Linear", "dataset_id": path})
+    session = str(tmp_path / "plot.schplot")
+    save_session(session, {path: dataset}, [plot], {"title": "saved"})
+    return session, path
+
+def rewrite(session, edit):
+    with zipfile.ZipFile(session) as archive:
+        members = {name: archive.read(name) for name in archive.namelist()}
+    data = json.loads(members[SESSION_FILE])
+    edit(data)
+    members[SESSION_FILE] = json.dumps(data).encode("utf-8")
+    with zipfile.ZipFile(session, "w") as archive:
+        for name, content in members.items():
+            archive.writestr(name, content)
+
+def test_session_datasets_hold_only_saved_columns(saved):
+    session, path = saved
+    datasets, plots, view = load_session(session, cache=RegressionCache())
+    dataset = datasets[path]
+    assert view["title"] == "saved" and plots[0].dataset_id == path
+    assert dataset.columns == ["t", "v"]
+    np.testing.assert_array_equal(dataset.column("v"), 2 * np.arange(40.0) + 1.5)
+    with pytest.raises(KeyError):
+        dataset.column("w")
+
+def test_session_missing_a_plotted_column_fails_clearly(saved):
+    session, _ = saved
+    rewrite(session, lambda data: data["datasets"][0]["arrays"].pop("v"))
+    with pytest.raises(ValueError, match="does not contain column 'v' of data.csv"):
+        load_session(session, cache=RegressionCache())
+
+def write_format_1(path, source, arrays):
+    session = {
+        "format": 1,
+        "source": {"path": source, "version": [source, 0, 0], "columns": ["t", "v", "w"]},
+        "arrays": {name: f"columns/{index}.npy" for index, name in enumerate(arrays)},
+        "view": {"title": "old"},
+        "plots": [{"x_var": "t", "y_var": "v", "regression": "Linear"}],
+        "regressions": [None]
+    }
+    with zipfile.ZipFile(path, "w") as archive:
+        for name, member in session["arrays"].items():
+            buffer = io.BytesIO()
+            np.save(buffer, arrays[name])
+            archive.writestr(member, buffer.getvalue())
+        archive.writestr(SESSION_FILE, json.dumps(session))
+
+def test_format_1_session_maps_to_one_dataset(tmp_path):
+    session = str(tmp_path / "old.schplot")
+    source = str(tmp_path / "gone.csv")
+    write_format_1(session, source, {"t": np.arange(5.0), "v": np.arange(5.0) * 2})
+    datasets, plots, view = load_session(session, cache=RegressionCache())
+    assert list(datasets) == [source] and plots[0].dataset_id == source
+    assert view["title"] == "old"
+    assert datasets[source].columns == ["t", "v"]
+    np.testing.assert_array_equal(datasets[source].column("v"), np.arange(5.0) * 2)
+
+def test_format_1_session_missing_a_plotted_column_fails_clearly(tmp_path):
+    session = str(tmp_path / "old.schplot")
+    write_format_1(session, str(tmp_path / "gone.csv"), {"t": np.arange(5.0)})
+    with pytest.raises(ValueError, match="does not contain column 'v' of gone.csv"):
+        load_session(session, cache=RegressionCache())
+
+def test_session_loads_after_its_source_file_is_removed(saved):
+    session, path = saved
+    os.remove(path)
+    datasets, plots, _ = load_session(session, cache=RegressionCache())
+    dataset = datasets[path].load(["t", "v", "w"])
+    assert len(dataset.column("t")) == len(dataset.column("v")) == 40
\ No newline at end of file
@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+from schplot.dataset import Dataset
+from schplot.logic import RunningRegression, calculate_regression_stats
+from schplot.plot_settings import PlotSettings
+from schplot.stream import LiveSession, RingBuffer, TailReader
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("SCHPLOT_CACHE_DIR", str(tmp_path / "cache"))
+
+def rows(start, stop):
+    return "".join(f'"{index}","{2 * index + 1},5"\n' for index in range(start, stop))
+
+def append(path, text):
+    with open(path, "a", encoding="utf-8") as handle:
+        handle.write(text)
+
+def live_plot(path):
+    return PlotSettings.from_dict({"x_var": "t", "y_var": "v", "regression": "Linear", "dataset_id": path})
+
+@pytest.fixture
+def log(tmp_path):
+    path = str(tmp_path / "log.csv")
+    with open(path, "w", encoding="utf-8") as handle:
+        handle.write('"t","v"\n' + rows(0, 100))
+    return path
+
+def test_rows_appended_between_open_and_load_are_counted_once(log):
+    dataset = Dataset(log)
+    append(log, rows(100, 150))
+    dataset.load(["t", "v"])
+    plot = live_plot(log)
+    live = LiveSession(dataset, [plot], 1000).catch_up(dataset)
+    x, _ = live.series(plot)
+    assert len(x) == 150 and len(np.unique(x)) == 150
+    assert live.regressions[plot].n == 150
+    append(log, rows(150, 160))
+    live.poll()
+    np.testing.assert_array_equal(live.series(plot)[0], np.arange(160.0))
+    assert live.regressions[plot].n == 160
+
+def test_partial_line_at_load_time_is_completed_by_the_tail(log):
+    append(log, '"100","20')
+    dataset = Dataset(log).load(["t", "v"])
+    plot = live_plot(log)
+    live = LiveSession(dataset, [plot], 1000).catch_up(dataset)
+    assert len(live.series(plot)[0]) == 100
+    append(log, '1,5"\n')
+    live.poll()
+    x, y = live.series(plot)
+    assert len(x) == 101 and (x[-1], y[-1]) == (100.0, 201.5)
+    assert live.regressions[plot].n == 101
+
+def test_ring_buffer_keeps_the_last_values_and_returns_evicted():
+    buffer = RingBuffer(4)
+    assert len(buffer.extend(np.arange(3.0))) == 0
+    np.testing.assert_array_equal(buffer.extend(np.arange(3.0, 6.0)), [0.0, 1.0])
+    np.testing.assert_array_equal(buffer.view(), [2.0, 3.0, 4.0, 5.0])
+    np.testing.assert_array_equal(buffer.extend(np.arange(6.0, 12.0)), [2.0, 3.0, 4.0, 5.0, 6.0, 7.0])
+    np.testing.assert_array_equal(buffer.view(), [8.0, 9.0, 10.0, 11.0])
+
+def test_tail_reader_carries_lines_longer_than_a_block(log):
+    reader = TailReader(log, ["t", "v"], ["t", "v"])
+    reader.poll()
+    append(log, '"100","' + "1" * 5000 + '"\n' + rows(101, 102))
+    polled = []
+    for _ in range(20):
+        arrays, _, caught_up = reader.poll(1000)
+        if arrays:
+            polled += list(arrays["t"])
+        if caught_up:
+            break
+    assert polled == [100.0, 101.0]
+
+def test_tail_reader_restarts_after_truncation(log):
+    reader = TailReader(log, ["t", "v"], ["t", "v"])
+    reader.poll()
+    with open(log, "w", encoding="utf-8") as handle:
+        handle.write('"t","v"\n' + rows(0, 5))
+    arrays, reset, _ = reader.poll()
+    assert reset
+    np.testing.assert_array_equal(arrays["t"], np.arange(5.0))
+
+def test_sliding_window_regression_matches_refit():
+    rng = np.random.default_rng(0)
+    x = np.arange(1.0, 2001.0)
+    y = 0.5 * x + rng.normal(0.0, 3.0, len(x))
+    regression = RunningRegression("Linear")
+    window = 300
+    for start in range(0, len(x), 100):
+        regression.add(x[start:start + 100], y[start:start + 100])
+        if start >= window:
+            regression.remove(x[start - window:start - window + 100], y[start - window:start - window + 100])
+    expected = calculate_regression_stats(x[-window:], y[-window:], "Linear")
+    actual = regression.stats()
+    assert regression.n == window
+    np.testing.assert_allclose(actual["coefficients"], expected["coefficients"])
+    assert actual["r2"] == pytest.approx(expected["r2"])
\ No newline at end of file